@@ -1,3 +1,4 @@
 from .base import UC
+from .pool import UCPool
 
-__all__ = ["UC"]
+__all__ = ["UC", "UCPool"]
@@ -1,6 +1,246 @@
-from typing import Optional, Any, Union, List, Callable, Dict, Tuple
+import asyncio
+import base64
+import json
+import os
+import threading
+import time
+import weakref
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Any, Union, List, Callable, Dict, Tuple, Iterable
+
+from seleniumbase.config import settings
+
 from .cdpinterface import CDPInterface
 
+try:
+    # Optional C-accelerated JSON for the wrapper-side payloads
+    # (selector lists, get_many mappings) embedded into JS snippets.
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+    _json_dumps = json.dumps
+
+# In-page visibility check shared by the click/find templates below:
+# non-zero bounding rect plus computed visibility/display, evaluated
+# browser-side so no per-element round-trips are needed.
+_JS_VIS_HELPER = (
+    "const vis = el => { const r = el.getBoundingClientRect(); if (!(r.width || r.height)) return false; const st = getComputedStyle(el); return st.visibility !== 'hidden' && st.display !== 'none'; };"
+)
+
+# JS snippet templates, frozen at import. Rendered snippets are
+# memoized below so a selector that is probed thousands of times per
+# session only pays the string formatting (and V8's parse of an
+# identical script body) once.
+_JS_RECT = (
+    "JSON.parse(JSON.stringify(document.querySelector(%s)"
+    ".getBoundingClientRect()))"
+)
+_JS_PRESENT = "!!document.querySelector(%s)"
+# One-round-trip wait: the promise resolves the moment a DOM mutation
+# makes the predicate pass (or at the timeout), so the whole wait
+# costs a single CDP request with awaitPromise instead of a poll loop.
+_JS_WAIT_PROMISE = (
+    "new Promise((resolve) => {"
+    " const pred = () => { try { return !!(%s); }"
+    " catch (e) { return false; } };"
+    " if (pred()) { resolve(true); return; }"
+    " const obs = new MutationObserver(() => {"
+    " if (pred()) { obs.disconnect(); clearTimeout(t); resolve(true); } });"
+    " obs.observe(document.documentElement,"
+    " {subtree: true, childList: true,"
+    " attributes: true, characterData: true});"
+    " const t = setTimeout(() => {"
+    " obs.disconnect(); resolve(false); }, %d);"
+    " })"
+)
+_JS_VISIBLE = (
+    "(() => { const e = document.querySelector(%s);"
+    " if (!e) return false;"
+    " const r = e.getBoundingClientRect();"
+    " return !!(r.width || r.height); })()"
+)
+# Upstream text_all joins text nodes with single spaces, while raw
+# textContent concatenates them; collapsing whitespace runs keeps the
+# probes in line for text spanning node boundaries (Hello<br>world).
+_JS_TEXT_VISIBLE = (
+    "(() => { const e = document.querySelector(%s);"
+    " return !!e &&"
+    " e.textContent.replace(/\\s+/g, ' ').includes(%s); })()"
+)
+_JS_TEXT_EXACT = (
+    "(() => { const e = document.querySelector(%s);"
+    " return !!e &&"
+    " e.textContent.replace(/\\s+/g, ' ').trim() === %s; })()"
+)
+# assert_exact_text (unlike is_exact_text_visible) also requires the
+# element to be visible upstream.
+_JS_TEXT_EXACT_VISIBLE = (
+    "(() => { const e = document.querySelector(%s);"
+    " if (!e) return false;"
+    " const r = e.getBoundingClientRect();"
+    " if (!(r.width || r.height)) return false;"
+    " return e.textContent.replace(/\\s+/g, ' ').trim() === %s; })()"
+)
+_JS_CLICK_VISIBLE = (
+    "(() => { " + _JS_VIS_HELPER + " let n = 0;"
+    " for (const el of document.querySelectorAll(%s)) {"
+    " if (vis(el)) {"
+    " el.click(); n++;"
+    " if (%s && n >= %s) break; } }"
+    " return n; })()"
+)
+_JS_CLICK_NTH_VISIBLE = (
+    "(() => { " + _JS_VIS_HELPER + " let n = 0;"
+    " for (const el of document.querySelectorAll(%s)) {"
+    " if (vis(el)) {"
+    " if (n === %s) { el.click(); return true; }"
+    " n++; } }"
+    " return false; })()"
+)
+_JS_CLICK_IF_VISIBLE = (
+    "(() => { " + _JS_VIS_HELPER + " const e = document.querySelector(%s);"
+    " if (!e || !vis(e)) return false;"
+    " e.click(); return true; })()"
+)
+# In-page selector cache: querySelector results are kept in
+# window.__ucSelCache and retired by a MutationObserver, so repeated
+# probes of an unchanged DOM skip the traversal entirely. The
+# bootstrap is idempotent and inlined into each cached query, which
+# keeps it correct across navigations (fresh window, fresh cache).
+_JS_SEL_CACHE_QUERY = (
+    "(() => {"
+    " if (!window.__ucSelCache) {"
+    " window.__ucSelCache = new Map();"
+    " new MutationObserver(() => window.__ucSelCache.clear())"
+    ".observe(document.documentElement,"
+    " {subtree: true, childList: true,"
+    " attributes: true, characterData: true}); }"
+    " const key = %s;"
+    " let e = window.__ucSelCache.get(key);"
+    " if (e === undefined || (e && !e.isConnected)) {"
+    " e = document.querySelector(key);"
+    " window.__ucSelCache.set(key, e); }"
+    " return e ? (%s) : (%s); })()"
+)
+
+_JS_PRESENT_MAP = "%s.map(s => !!document.querySelector(s))"
+_JS_PRESENT_ALL = "%s.every(s => !!document.querySelector(s))"
+# Atomic check-state toggle: read and click in one script so there is
+# no race window between the state check and the click.
+_JS_TOGGLE_IF = (
+    "(() => { const e = document.querySelector(%s);"
+    " if (!e) return null;"
+    " const cur = !!(e.checked || e.selected);"
+    " if (cur === %s) return false;"
+    " e.click(); return true; })()"
+)
+_JS_INSERT_TEXT = (
+    "(() => { const e = document.activeElement;"
+    " if (!e) return false;"
+    " const tag = e.tagName;"
+    " if (tag === 'INPUT' || tag === 'TEXTAREA') {"
+    " const start = e.selectionStart ?? e.value.length;"
+    " const end = e.selectionEnd ?? e.value.length;"
+    " e.setRangeText(%s, start, end, 'end');"
+    " e.dispatchEvent(new Event('input', {bubbles: true}));"
+    " return true; }"
+    " if (e.isContentEditable) {"
+    " document.execCommand('insertText', false, %s);"
+    " return true; }"
+    " return false; })()"
+)
+_JS_NESTED_CLICK = (
+    "(() => { const p = document.querySelector(%s);"
+    " const c = p && p.querySelector(%s);"
+    " if (!c) return false;"
+    " c.click(); return true; })()"
+)
+_JS_SELECT_OPTION_BY_TEXT = (
+    "(() => { const d = document.querySelector(%s);"
+    " if (!d) return false;"
+    " for (const o of d.querySelectorAll('option')) {"
+    " if (o.textContent.trim() === %s) {"
+    " o.selected = true;"
+    " d.dispatchEvent(new Event('change', {bubbles: true}));"
+    " return true; } }"
+    " return false; })()"
+)
+_JS_SET_ATTRIBUTES_MANY = (
+    "(() => { const triples = %s; let n = 0;"
+    " for (const [s, a, v] of triples) {"
+    " const e = document.querySelector(s);"
+    " if (e) { e.setAttribute(a, v); n++; } }"
+    " return n; })()"
+)
+# The path is wrapped in an object because the evaluate facade turns
+# falsy values into None: documentElement's legitimate empty path []
+# must stay distinguishable from "no element matches" (null).
+_JS_ELEMENT_PATH = (
+    "(() => { let el = document.querySelector(%s);"
+    " if (!el) return null;"
+    " const p = [];"
+    " while (el.parentElement) {"
+    " p.push([...el.parentElement.children].indexOf(el));"
+    " el = el.parentElement; }"
+    " return {p: p.reverse()}; })()"
+)
+_JS_ALL_TEXT = (
+    "Array.from(document.querySelectorAll(%s)).map(e => e.innerText)"
+)
+_JS_ALL_ATTRIBUTE = (
+    "Array.from(document.querySelectorAll(%s)).map(e => e.getAttribute(%s))"
+)
+_JS_GET_MANY = (
+    "(() => { const sels = %s; const out = {};"
+    " for (const k in sels) {"
+    " const e = document.querySelector(sels[k]);"
+    " out[k] = e ? e.textContent : null; }"
+    " return out; })()"
+)
+_JS_VISIBLE_INDICES = (
+    "(() => { " + _JS_VIS_HELPER + " const out = [];"
+    " const els = document.querySelectorAll(%s);"
+    " for (let i = 0; i < els.length; i++) {"
+    " if (vis(els[i])) out.push(i); }"
+    " return out; })()"
+)
+
+
+# Background writer for screenshot bytes, so disk I/O overlaps with
+# the next CDP call instead of blocking it.
+_file_writer = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="seleniumuc-io"
+)
+
+
+def _write_bytes(filename: str, data: bytes) -> None:
+    with open(filename, "wb") as f:
+        f.write(data)
+
+
+def _surface_write_error(future) -> None:
+    """Report a failed background write instead of swallowing it."""
+    exc = future.exception()
+    if exc is not None:
+        print("Warning: background screenshot write failed: %s" % exc)
+
+
+@lru_cache(maxsize=1024)
+def _render_js(template: str, *args: str) -> str:
+    """Render (and memoize) a JS snippet from a frozen template."""
+    return template % args
+
+
+@lru_cache(maxsize=256)
+def _selector_list_js(selectors: tuple) -> str:
+    """Memoize the JSON payload for a recurring selector list."""
+    return _json_dumps(list(selectors))
+
 
 class CDPWrapper:
     """
@@ -13,7 +253,19 @@ class CDPWrapper:
         _cdp: The underlying CDP object that implements the actual functionality.
     """
 
-    __slots__ = ("_cdp",)
+    # Unknown attributes delegate to the underlying CDP object via
+    # __getattr__, which caches the bound method in the instance
+    # __dict__ so later calls are plain attribute dispatch. Methods
+    # that rename arguments, batch work in JS, or maintain the
+    # selector cache stay as real methods.
+    __slots__ = (
+        "_cdp",
+        "_cdp_lock",
+        "_sel_cache",
+        "_read_cache",
+        "_dom_epoch",
+        "__dict__",
+    )
 
     def __init__(self, cdp: CDPInterface):
         """
@@ -23,182 +275,660 @@ class CDPWrapper:
             cdp (CDPInterface): The underlying CDP instance to wrap.
         """
         self._cdp = cdp
+        self._cdp_lock = threading.Lock()
+        self._sel_cache = {}
+        self._read_cache = {}
+        self._dom_epoch = 0
+        self._subscribe_dom_invalidation()
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate unknown attributes to the underlying CDP object.
+
+        The resolved bound method is cached on the instance, so every
+        later call is plain instance-attribute dispatch with no
+        __getattr__ or wrapper-frame overhead.
+        """
+        if name.startswith("_"):
+            raise AttributeError(
+                "'%s' object has no attribute '%s'"
+                % (type(self).__name__, name)
+            )
+        attr = getattr(self._cdp, name)
+        if callable(attr):
+            # Only memoize bound methods; data attributes like .page
+            # get reassigned by tab switches and must stay live.
+            self.__dict__[name] = attr
+        return attr
+
+    def _subscribe_dom_invalidation(self) -> None:
+        """Bump the DOM epoch on navigation/document-swap CDP events.
+
+        The epoch is part of every selector-cache key, so a bump
+        retires all cached resolutions at once.
+        """
+        try:
+            import mycdp
+
+            def _bump(event) -> None:
+                self._dom_epoch += 1
+                self._sel_cache.clear()
+
+            self._cdp.add_handler(mycdp.page.FrameNavigated, _bump)
+            self._cdp.add_handler(mycdp.dom.DocumentUpdated, _bump)
+        except Exception:
+            # Cache still works; it just relies on the explicit
+            # invalidation hooks in the navigation methods below.
+            pass
 
     def sleep(self, seconds: Union[int, float]) -> None:
         """
         Pause execution for a given number of seconds.
 
+        The wait runs on the CDP event loop instead of blocking in
+        time.sleep, so the websocket reader keeps draining and
+        handlers registered with add_handler fire during the pause.
+
         Args:
             seconds (Union[int, float]): The number of seconds to sleep.
         """
-        return self._cdp.sleep(seconds)
+        try:
+            loop = self._cdp.get_event_loop()
+        except Exception:
+            loop = None
+        if loop is not None and not loop.is_running():
+            loop.run_until_complete(asyncio.sleep(seconds))
+        else:
+            time.sleep(seconds)
 
-    def type(self, selector: str, text: str, timeout: Optional[int] = None) -> None:
+    def sleep_until(
+        self,
+        predicate: Callable[[], bool],
+        timeout: Optional[float] = None,
+        interval: Optional[float] = None,
+    ) -> bool:
         """
-        Type a string into an element identified by the CSS selector.
+        Sleep cooperatively until a Python predicate returns true.
+
+        Polls with the same ramping backoff as the wait_for_* methods
+        (or a fixed interval when given), yielding to the CDP event
+        loop between ticks.
 
         Args:
-            selector (str): The CSS selector for the target element.
-            text (str): The text to be typed.
-            timeout (Optional[int]): Maximum time to wait (in seconds) before timing out.
-        """
-        return self._cdp.type(selector, text, timeout=timeout)
+            predicate (Callable[[], bool]): Re-evaluated each tick.
+            timeout (Optional[float]): Seconds before giving up.
+            interval (Optional[float]): Fixed seconds between ticks.
 
-    def mouse_click(self, selector: str, timeout: Optional[int] = None) -> None:
+        Returns:
+            bool: True if the predicate passed before the timeout.
         """
-        Perform a mouse click on an element specified by the CSS selector.
+        if not timeout:
+            timeout = settings.SMALL_TIMEOUT
+        deadline = time.monotonic() + timeout
+        tick = 0
+        while True:
+            if predicate():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            if interval is not None:
+                pause = interval
+            elif tick < len(self._WAIT_INTERVALS):
+                pause = self._WAIT_INTERVALS[tick]
+            else:
+                pause = 0.1
+            tick += 1
+            self.sleep(pause)
 
-        Args:
-            selector (str): The CSS selector for the element to click.
-            timeout (Optional[int]): Timeout in seconds.
+    def _locked_probe(self, js_predicate: str) -> bool:
+        """Evaluate a predicate once, serialized against other threads.
+
+        The sync CDP facade drives one event loop, so concurrent async
+        waits funnel their probes through this lock.
         """
-        return self._cdp.click(selector, timeout=timeout)
+        with self._cdp_lock:
+            try:
+                return bool(self._cdp.evaluate(js_predicate))
+            except Exception:
+                return False
 
-    def reload(
+    async def _a_wait_predicate(
+        self, js_predicate: str, timeout: Optional[float] = None
+    ) -> bool:
+        """Async predicate wait; independent waits overlap under gather.
+
+        Each probe runs in a worker thread (serialized by _cdp_lock),
+        and the coroutine yields between ticks, so several waits
+        interleave and total wall time approaches the max instead of
+        the sum.
+        """
+        if not timeout:
+            timeout = settings.SMALL_TIMEOUT
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout
+        tick = 0
+        while True:
+            ok = await loop.run_in_executor(
+                None, self._locked_probe, js_predicate
+            )
+            if ok:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            if tick < len(self._WAIT_INTERVALS):
+                pause = self._WAIT_INTERVALS[tick]
+            else:
+                pause = 0.1
+            tick += 1
+            await asyncio.sleep(pause)
+
+    async def a_wait_for_element_visible(
+        self, selector: str, timeout: Optional[float] = None
+    ) -> bool:
+        """Async wait_for_element_visible; returns a gather-friendly bool."""
+        if not self._is_plain_css(selector):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._locked_wait, "wait_for_element_visible",
+                selector, timeout,
+            )
+        return await self._a_wait_predicate(
+            _render_js(_JS_VISIBLE, self._js_selector(selector)), timeout
+        )
+
+    async def a_wait_for_element_not_visible(
+        self, selector: str, timeout: Optional[float] = None
+    ) -> bool:
+        """Async wait_for_element_not_visible; returns a bool."""
+        if not self._is_plain_css(selector):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._locked_wait, "wait_for_element_not_visible",
+                selector, timeout,
+            )
+        predicate = "!(%s)" % _render_js(
+            _JS_VISIBLE, self._js_selector(selector)
+        )
+        return await self._a_wait_predicate(predicate, timeout)
+
+    async def a_wait_for_element_absent(
+        self, selector: str, timeout: Optional[float] = None
+    ) -> bool:
+        """Async wait_for_element_absent; returns a bool."""
+        if not self._is_plain_css(selector):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._locked_wait, "wait_for_element_absent",
+                selector, timeout,
+            )
+        predicate = "!(%s)" % _render_js(
+            _JS_PRESENT, self._js_selector(selector)
+        )
+        return await self._a_wait_predicate(predicate, timeout)
+
+    async def a_wait_for_text(
         self,
-        ignore_cache: Optional[bool] = None,
-        script_to_evaluate_on_load: Optional[str] = None,
+        text: str,
+        selector: str = "body",
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Async wait_for_text; returns a gather-friendly bool."""
+        if not self._is_plain_css(selector):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._locked_wait, "wait_for_text",
+                text, selector, timeout,
+            )
+        return await self._a_wait_predicate(
+            self._text_probe(selector, text, False), timeout
+        )
+
+    def _locked_wait(self, name: str, *args) -> bool:
+        """Run a sync wait under the CDP lock (non-CSS selector path)."""
+        with self._cdp_lock:
+            try:
+                getattr(self._cdp, name)(*args)
+                return True
+            except Exception:
+                return False
+
+    # Back-to-back reads of slow-changing values (window geometry,
+    # title, URL, user agent) within this window share one round-trip.
+    _READ_TTL = 0.05
+
+    def _cached_read(self, name: str) -> Any:
+        """Serve an idempotent zero-arg read through a short TTL cache."""
+        entry = self._read_cache.get(name)
+        now = time.monotonic()
+        if entry is not None and now - entry[1] < self._READ_TTL:
+            return entry[0]
+        value = getattr(self._cdp, name)()
+        self._read_cache[name] = (value, now)
+        return value
+
+    def get_title(self) -> str:
+        """Retrieve the title of the current page."""
+        return self._cached_read("get_title")
+
+    def get_current_url(self) -> str:
+        """Retrieve the URL of the current page."""
+        return self._cached_read("get_current_url")
+
+    def get_origin(self) -> str:
+        """Retrieve the origin (protocol + domain) of the current page."""
+        return self._cached_read("get_origin")
+
+    def get_user_agent(self) -> str:
+        """Retrieve the user agent string of the browser."""
+        return self._cached_read("get_user_agent")
+
+    def get_locale_code(self) -> str:
+        """Retrieve the locale code used by the browser."""
+        return self._cached_read("get_locale_code")
+
+    def get_screen_rect(self) -> Dict[str, int]:
+        """Retrieve the dimensions of the screen."""
+        return self._cached_read("get_screen_rect")
+
+    def get_window_rect(self) -> Dict[str, int]:
+        """Retrieve the dimensions and position of the browser window."""
+        return self._cached_read("get_window_rect")
+
+    def get_window_size(self) -> Dict[str, int]:
+        """Retrieve the size (width and height) of the browser window."""
+        return self._cached_read("get_window_size")
+
+    def get_window_position(self) -> Dict[str, int]:
+        """Retrieve the position (x and y) of the browser window."""
+        return self._cached_read("get_window_position")
+
+    def set_window_rect(
+        self,
+        x: Optional[int] = None,
+        y: Optional[int] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
     ) -> None:
+        """Set the dimensions and position of the browser window."""
+        self._read_cache.clear()
+        return self._cdp.set_window_rect(x=x, y=y, width=width, height=height)
+
+    def maximize(self) -> None:
+        """Maximize the browser window."""
+        self._read_cache.clear()
+        return self._cdp.maximize()
+
+    def minimize(self) -> None:
+        """Minimize the browser window."""
+        self._read_cache.clear()
+        return self._cdp.minimize()
+
+    def medimize(self) -> None:
+        """Set the browser window to a medium size."""
+        self._read_cache.clear()
+        return self._cdp.medimize()
+
+    def reset_window_size(self) -> None:
+        """Reset the browser window to its default size."""
+        self._read_cache.clear()
+        return self._cdp.reset_window_size()
+
+    def switch_to_window(self, window: Union[str, int]) -> None:
+        """Switch focus to a specific browser window."""
+        self._invalidate_selector_cache()
+        return self._cdp.switch_to_window(window)
+
+    def switch_to_newest_window(self) -> None:
+        """Switch focus to the most recently opened browser window."""
+        self._invalidate_selector_cache()
+        return self._cdp.switch_to_newest_window()
+
+    def switch_to_tab(self, tab: Union[str, int]) -> None:
+        """Switch focus to a specific browser tab."""
+        self._invalidate_selector_cache()
+        return self._cdp.switch_to_tab(tab)
+
+    def switch_to_newest_tab(self) -> None:
+        """Switch focus to the most recently opened browser tab."""
+        self._invalidate_selector_cache()
+        return self._cdp.switch_to_newest_tab()
+
+    def gui_write(self, text: str) -> None:
         """
-        Reload the current page.
+        Write text using GUI automation.
+
+        When the focused element is a text input, textarea or
+        contenteditable node, the whole string is inserted with one
+        CDP evaluate (no per-character key events and no pyautogui
+        import). Anything else falls back to the real GUI typing path.
 
         Args:
-            ignore_cache (Optional[bool]): Whether to ignore the browser cache.
-            script_to_evaluate_on_load (Optional[str]): JavaScript to execute when the page loads.
+            text (str): The text to write.
         """
-        return self._cdp.reload(ignore_cache, script_to_evaluate_on_load)
+        try:
+            payload = _json_dumps(text)
+            inserted = self._cdp.evaluate(
+                _render_js(_JS_INSERT_TEXT, payload, payload)
+            )
+            if inserted:
+                return None
+        except Exception:
+            pass
+        return self._cdp.gui_write(text)
 
-    def refresh(self) -> None:
-        """
-        Refresh the current page. This is an alias for reload() without additional parameters.
+    def save_screenshot(
+        self, name: str, folder: Optional[str] = None, selector: Optional[str] = None
+    ) -> str:
         """
-        return self._cdp.refresh()
+        Save a screenshot of the current page or a specific element.
 
-    def find_element(
-        self, selector: str, best_match: bool = False, timeout: Optional[int] = None
-    ) -> Optional[Any]:
-        """
-        Find a single element matching the given CSS selector.
+        Full-page captures to a ".webp" filename go through
+        Page.captureScreenshot with webp encoding (smaller and cheaper
+        than PNG) and the decoded bytes are written on a background
+        thread, so the next CDP call is not blocked on disk I/O.
+        Element captures and other formats take the underlying path.
 
         Args:
-            selector (str): The CSS selector to search for.
-            best_match (bool): Whether to return the best matching element.
-            timeout (Optional[int]): Maximum wait time in seconds.
+            name (str): The file name for the screenshot.
+            folder (Optional[str]): The folder in which to save it.
+            selector (Optional[str]): If provided, only capture the
+                element matching this selector.
+
+        Returns:
+            str: The path to the (possibly still-writing) screenshot.
+        """
+        filename = os.path.join(folder, name) if folder else name
+        if name.endswith(".webp") and not selector:
+            try:
+                from mycdp import page as cdp_page
+
+                if folder and not os.path.exists(folder):
+                    os.makedirs(folder)
+                tab = self._cdp.page
+                loop = self._cdp.get_event_loop()
+                data = loop.run_until_complete(
+                    tab.send(
+                        cdp_page.capture_screenshot(
+                            format_="webp", quality=80
+                        )
+                    )
+                )
+                future = _file_writer.submit(
+                    _write_bytes, filename, base64.b64decode(data)
+                )
+                future.add_done_callback(_surface_write_error)
+                return filename
+            except Exception:
+                pass
+        return self._cdp.save_screenshot(name, folder, selector)
+
+    def get_document_raw(self) -> Any:
+        """
+        Fetch the DOM tree exactly as the protocol delivers it.
+
+        Sends DOM.getDocument straight through the tab and returns the
+        raw node structure with none of the post-processing that
+        get_document() applies, so callers that only search or
+        serialize avoid building the intermediate objects.
 
         Returns:
-            Optional[Any]: The found element or None if not found.
+            Any: The raw DOM.getDocument result (full depth, piercing
+            shadow roots and iframes).
         """
-        return self._cdp.find_element(selector, best_match, timeout)
+        from mycdp import dom
 
-    def get_attribute(self, selector: str, attribute: str) -> str:
+        tab = self._cdp.page
+        loop = self._cdp.get_event_loop()
+        return loop.run_until_complete(
+            tab.send(dom.get_document(depth=-1, pierce=True))
+        )
+
+    def fast(self) -> Any:
         """
-        Retrieve the value of a specific attribute from an element.
+        Return the underlying CDP object for direct access.
 
-        Args:
-            selector (str): The CSS selector for the element.
-            attribute (str): The name of the attribute.
+        Hot loops can grab this once and call methods on it directly,
+        skipping the wrapper's caching and dispatch layers entirely:
+
+        .. code-block:: python
+            c = cdp.fast()
+            while c.is_element_present("#spinner"):
+                ...
 
         Returns:
-            str: The value of the attribute.
+            Any: The wrapped CDP instance.
         """
-        return self._cdp.get_attribute(selector, attribute)
+        return self._cdp
 
-    def is_element_visible(self, selector: str) -> bool:
+    def send_many(self, commands: Iterable) -> List[Any]:
         """
-        Determine whether an element identified by the selector is visible on the page.
+        Dispatch several raw CDP commands concurrently.
+
+        The commands are submitted together and awaited with one
+        asyncio.gather on the CDP event loop, so their round-trips
+        overlap instead of serializing; results come back in command
+        order.
 
         Args:
-            selector (str): The CSS selector for the element.
+            commands (Iterable): Raw CDP command objects (e.g. mycdp
+                generators) accepted by the tab's send().
 
         Returns:
-            bool: True if the element is visible; otherwise, False.
+            List[Any]: The per-command results, in order.
         """
-        return self._cdp.is_element_visible(selector)
+        commands = list(commands)
+        if not commands:
+            return []
+        tab = self._cdp.page
+        loop = self._cdp.get_event_loop()
 
-    def get(self, url: str) -> None:
-        """
-        Navigate the browser to the specified URL.
+        async def _send_batch():
+            return await asyncio.gather(*(tab.send(cmd) for cmd in commands))
 
-        Args:
-            url (str): The URL to navigate to.
-        """
-        return self._cdp.get(url)
+        return loop.run_until_complete(_send_batch())
 
-    def open(self, url: str) -> None:
+    def pipeline(self) -> "CDPPipeline":
         """
-        Open a new URL in the browser. This is an alias for the get() method.
+        Return a context manager that queues calls and flushes them together.
 
-        Args:
-            url (str): The URL to open.
+        Raw CDP commands queued with send() are dispatched concurrently
+        in one asyncio.gather on the CDP event loop, so their
+        round-trips overlap instead of serializing. Facade method calls
+        are queued and executed in order at flush time. Results land in
+        .results in call order.
+
+        Example:
+        --------
+        .. code-block:: python
+            with cdp.pipeline() as p:
+                p.send(network.set_cache_disabled(True))
+                p.send(emulation.set_locale_override("en-US"))
+            results = p.results
         """
-        return self._cdp.open(url)
+        return CDPPipeline(self)
+
+    # Documented alias from the batching proposal.
+    batch = pipeline
 
-    def get_event_loop(self) -> Any:
+    def bring_to_front(self) -> None:
         """
-        Retrieve the current event loop for CDP operations.
+        Bring the active window to the front (alias for bring_active_window_to_front).
 
         Returns:
-            Any: The event loop object.
+            None
         """
-        return self._cdp.get_event_loop()
+        return self._cdp.bring_active_window_to_front()
+
+    def _invalidate_selector_cache(self) -> None:
+        """Retire all cached selector resolutions and read values."""
+        self._dom_epoch += 1
+        self._sel_cache.clear()
+        self._read_cache.clear()
+
+    clear_selector_cache = _invalidate_selector_cache
+
+    def _sel_cached(self, key: tuple) -> Optional[Any]:
+        """Return a live cached value for a selector-cache key, if any."""
+        ref = self._sel_cache.get(key)
+        if ref is None:
+            return None
+        if isinstance(ref, weakref.ref):
+            return ref()
+        return ref
+
+    # Ramping poll intervals for _wait_predicate: fast at first so
+    # short waits resolve at near-mutation latency, backing off to
+    # 100ms ticks for long waits.
+    _WAIT_INTERVALS = (0.01, 0.01, 0.02, 0.02, 0.05, 0.05)
+
+    def _wait_predicate(
+        self, js_predicate: str, timeout: Optional[float] = None
+    ) -> bool:
+        """Poll a boolean JS predicate until true or the timeout passes.
+
+        Preferred path: one Runtime.evaluate with awaitPromise whose
+        promise is resolved by a MutationObserver the instant the
+        predicate passes, so the whole wait costs a single round-trip.
+        When the async tab is unavailable, falls back to polling the
+        predicate with a ramping backoff (no element objects cross the
+        wire either way).
+
+        Args:
+            js_predicate (str): A JS expression evaluating to a bool.
+            timeout (Optional[float]): Seconds before giving up.
+
+        Returns:
+            bool: True if the predicate became true in time.
+        """
+        if not timeout:
+            timeout = settings.SMALL_TIMEOUT
+        try:
+            tab = self._cdp.page
+            loop = self._cdp.get_event_loop()
+            result = loop.run_until_complete(
+                tab.evaluate(
+                    _JS_WAIT_PROMISE % (js_predicate, int(timeout * 1000)),
+                    await_promise=True,
+                )
+            )
+            return bool(result)
+        except Exception:
+            # Older facades without the async tab fall back to polling.
+            pass
+        deadline = time.monotonic() + timeout
+        tick = 0
+        while True:
+            try:
+                if self._cdp.evaluate(js_predicate):
+                    return True
+            except Exception:
+                pass
+            if time.monotonic() >= deadline:
+                return False
+            if tick < len(self._WAIT_INTERVALS):
+                interval = self._WAIT_INTERVALS[tick]
+            else:
+                interval = 0.1
+            tick += 1
+            time.sleep(interval)
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _js_selector(selector: str) -> str:
+        """Return the selector as a safely quoted JS string literal."""
+        return _json_dumps(selector)
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _is_plain_css(selector: str) -> bool:
+        """True when querySelector() can evaluate the selector as-is.
+
+        XPath selectors and SeleniumBase's :contains() extension need
+        the underlying conversion machinery instead.
+        """
+        return not (
+            selector.startswith("/")
+            or selector.startswith("./")
+            or selector.startswith("(")
+            or ":contains(" in selector
+        )
+
+    def _sel_store(self, key: tuple, value: Any) -> Any:
+        """Cache a selector resolution, weakly when possible."""
+        if value is not None:
+            try:
+                self._sel_cache[key] = weakref.ref(value)
+            except TypeError:
+                self._sel_cache[key] = value
+        return value
 
-    def add_handler(self, event: str, handler: Callable) -> None:
+    def type(self, selector: str, text: str, timeout: Optional[int] = None) -> None:
         """
-        Add a handler function for a specific CDP event.
+        Type a string into an element identified by the CSS selector.
 
         Args:
-            event (str): The name of the event.
-            handler (Callable): The callback function to handle the event.
+            selector (str): The CSS selector for the target element.
+            text (str): The text to be typed.
+            timeout (Optional[int]): Maximum time to wait (in seconds) before timing out.
         """
-        return self._cdp.add_handler(event, handler)
+        self._invalidate_selector_cache()
+        return self._cdp.type(selector, text, timeout=timeout)
 
-    def find(
-        self, selector: str, best_match: bool = False, timeout: Optional[int] = None
-    ) -> Any:
+    def reload(
+        self,
+        ignore_cache: Optional[bool] = None,
+        script_to_evaluate_on_load: Optional[str] = None,
+    ) -> None:
         """
-        Find an element matching the given CSS selector (alias for find_element).
+        Reload the current page.
 
         Args:
-            selector (str): The CSS selector for the element.
-            best_match (bool): Whether to use the best matching element.
-            timeout (Optional[int]): Maximum wait time in seconds.
-
-        Returns:
-            Any: The found element.
+            ignore_cache (Optional[bool]): Whether to ignore the browser cache.
+            script_to_evaluate_on_load (Optional[str]): JavaScript to execute when the page loads.
         """
-        return self._cdp.find(selector, best_match, timeout)
+        self._invalidate_selector_cache()
+        return self._cdp.reload(ignore_cache, script_to_evaluate_on_load)
+
+    # Documented aliases bound straight to their canonical
+    # implementations: same behavior, no duplicate bodies, and one
+    # dispatch instead of an extra delegating frame.
+    refresh = reload
 
-    def locator(
+    def find_element(
         self, selector: str, best_match: bool = False, timeout: Optional[int] = None
-    ) -> Any:
+    ) -> Optional[Any]:
         """
-        Obtain a locator for the element identified by the selector.
+        Find a single element matching the given CSS selector.
 
         Args:
-            selector (str): The CSS selector for the element.
-            best_match (bool): Whether to use the best matching element.
-            timeout (Optional[int]): Timeout in seconds.
+            selector (str): The CSS selector to search for.
+            best_match (bool): Whether to return the best matching element.
+            timeout (Optional[int]): Maximum wait time in seconds.
 
         Returns:
-            Any: The locator for the element.
+            Optional[Any]: The found element or None if not found.
         """
-        return self._cdp.locator(selector, best_match, timeout)
+        key = (self._dom_epoch, "element", selector, best_match)
+        element = self._sel_cached(key)
+        if element is not None:
+            return element
+        return self._sel_store(
+            key, self._cdp.find_element(selector, best_match, timeout)
+        )
 
-    def find_element_by_text(
-        self, text: str, tag_name: Optional[str] = None, timeout: Optional[int] = None
-    ) -> Any:
+    find = find_element
+    locator = find_element
+
+    def get(self, url: str) -> None:
         """
-        Locate an element based on its text content.
+        Navigate the browser to the specified URL.
 
         Args:
-            text (str): The text to search for.
-            tag_name (Optional[str]): Filter by a specific tag name if provided.
-            timeout (Optional[int]): Maximum wait time in seconds.
-
-        Returns:
-            Any: The found element.
+            url (str): The URL to navigate to.
         """
-        return self._cdp.find_element_by_text(text, tag_name, timeout)
+        self._invalidate_selector_cache()
+        return self._cdp.get(url)
+
+    open = get
 
     def find_all(self, selector: str, timeout: Optional[int] = None) -> List[Any]:
         """
@@ -211,22 +941,13 @@ class CDPWrapper:
         Returns:
             List[Any]: A list of matching elements.
         """
-        return self._cdp.find_all(selector, timeout)
-
-    def find_elements_by_text(
-        self, text: str, tag_name: Optional[str] = None
-    ) -> List[Any]:
-        """
-        Find all elements that contain the specified text.
-
-        Args:
-            text (str): The text to search for.
-            tag_name (Optional[str]): Optionally, filter by tag name.
-
-        Returns:
-            List[Any]: A list of elements with the matching text.
-        """
-        return self._cdp.find_elements_by_text(text, tag_name)
+        key = (self._dom_epoch, "find_all", selector)
+        elements = self._sel_cache.get(key)
+        if elements is not None:
+            return elements
+        elements = self._cdp.find_all(selector, timeout)
+        self._sel_cache[key] = elements
+        return elements
 
     def select(self, selector: str, timeout: Optional[int] = None) -> Any:
         """
@@ -239,7 +960,11 @@ class CDPWrapper:
         Returns:
             Any: The selected element.
         """
-        return self._cdp.select(selector, timeout)
+        key = (self._dom_epoch, "select", selector)
+        element = self._sel_cached(key)
+        if element is not None:
+            return element
+        return self._sel_store(key, self._cdp.select(selector, timeout))
 
     def select_all(self, selector: str, timeout: Optional[int] = None) -> List[Any]:
         """
@@ -252,7 +977,13 @@ class CDPWrapper:
         Returns:
             List[Any]: A list of selected elements.
         """
-        return self._cdp.select_all(selector, timeout)
+        key = (self._dom_epoch, "select_all", selector)
+        elements = self._sel_cache.get(key)
+        if elements is not None:
+            return elements
+        elements = self._cdp.select_all(selector, timeout)
+        self._sel_cache[key] = elements
+        return elements
 
     def find_elements(self, selector: str, timeout: Optional[int] = None) -> List[Any]:
         """
@@ -265,7 +996,13 @@ class CDPWrapper:
         Returns:
             List[Any]: A list of found elements.
         """
-        return self._cdp.find_elements(selector, timeout)
+        key = (self._dom_epoch, "find_elements", selector)
+        elements = self._sel_cache.get(key)
+        if elements is not None:
+            return elements
+        elements = self._cdp.find_elements(selector, timeout)
+        self._sel_cache[key] = elements
+        return elements
 
     def find_visible_elements(
         self, selector: str, timeout: Optional[int] = None
@@ -280,6 +1017,19 @@ class CDPWrapper:
         Returns:
             List[Any]: A list of visible elements.
         """
+        if self._is_plain_css(selector):
+            try:
+                indices = self._cdp.evaluate(
+                    _render_js(
+                        _JS_VISIBLE_INDICES, self._js_selector(selector)
+                    )
+                )
+                elements = self.select_all(selector, timeout)
+                return [
+                    elements[i] for i in indices if i < len(elements)
+                ]
+            except Exception:
+                pass
         return self._cdp.find_visible_elements(selector, timeout)
 
     def click_nth_element(self, selector: str, number: int) -> None:
@@ -290,6 +1040,7 @@ class CDPWrapper:
             selector (str): The CSS selector for the elements.
             number (int): The zero-based index of the element to click.
         """
+        self._invalidate_selector_cache()
         return self._cdp.click_nth_element(selector, number)
 
     def click_nth_visible_element(self, selector: str, number: int) -> None:
@@ -300,6 +1051,22 @@ class CDPWrapper:
             selector (str): The CSS selector for the elements.
             number (int): The index of the visible element to click.
         """
+        self._invalidate_selector_cache()
+        if self._is_plain_css(selector):
+            try:
+                clicked = self._cdp.evaluate(
+                    _render_js(
+                        _JS_CLICK_NTH_VISIBLE,
+                        self._js_selector(selector),
+                        # Upstream numbering is 1-based and clamps 0
+                        # to the first visible element.
+                        str(max(int(number) - 1, 0)),
+                    )
+                )
+                if clicked:
+                    return None
+            except Exception:
+                pass
         return self._cdp.click_nth_visible_element(selector, number)
 
     def click_link(self, link_text: str) -> None:
@@ -309,121 +1076,23 @@ class CDPWrapper:
         Args:
             link_text (str): The visible text of the link.
         """
+        self._invalidate_selector_cache()
         return self._cdp.click_link(link_text)
 
     def go_back(self) -> None:
         """
         Navigate back to the previous page in the browser history.
         """
+        self._invalidate_selector_cache()
         return self._cdp.go_back()
 
     def go_forward(self) -> None:
         """
         Navigate forward in the browser history.
         """
+        self._invalidate_selector_cache()
         return self._cdp.go_forward()
 
-    def get_navigation_history(self) -> Dict:
-        """
-        Retrieve the navigation history of the browser.
-
-        Returns:
-            Dict: A dictionary containing navigation history details.
-        """
-        return self._cdp.get_navigation_history()
-
-    def tile_windows(
-        self, windows: Optional[List] = None, max_columns: int = 0
-    ) -> None:
-        """
-        Arrange multiple browser windows in a tiled layout.
-
-        Args:
-            windows (Optional[List]): A list of window handles to tile.
-            max_columns (int): Maximum number of columns to arrange the windows.
-        """
-        return self._cdp.tile_windows(windows, max_columns)
-
-    def get_all_cookies(self, *args, **kwargs) -> List[Dict]:
-        """
-        Retrieve all cookies from the current browser session.
-
-        Returns:
-            List[Dict]: A list of dictionaries with cookie information.
-        """
-        return self._cdp.get_all_cookies(*args, **kwargs)
-
-    def set_all_cookies(self, *args, **kwargs) -> None:
-        """
-        Set cookies for the browser session.
-
-        Args:
-            *args: Additional positional arguments.
-            **kwargs: Additional keyword arguments.
-        """
-        return self._cdp.set_all_cookies(*args, **kwargs)
-
-    def save_cookies(self, *args, **kwargs) -> None:
-        """
-        Save the current cookies to a file.
-
-        Args:
-            *args: Additional positional arguments.
-            **kwargs: Additional keyword arguments.
-        """
-        return self._cdp.save_cookies(*args, **kwargs)
-
-    def load_cookies(self, *args, **kwargs) -> None:
-        """
-        Load cookies from a file into the browser session.
-
-        Args:
-            *args: Additional positional arguments.
-            **kwargs: Additional keyword arguments.
-        """
-        return self._cdp.load_cookies(*args, **kwargs)
-
-    def clear_cookies(self) -> None:
-        """
-        Clear all cookies from the current browser session.
-        """
-        return self._cdp.clear_cookies()
-
-    def bring_active_window_to_front(self) -> None:
-        """
-        Bring the active browser window to the front.
-
-        This method ensures that the active window is focused.
-        """
-        return self._cdp.bring_active_window_to_front()
-
-    def bring_to_front(self) -> None:
-        """
-        Bring the active window to the front (alias for bring_active_window_to_front).
-
-        Returns:
-            None
-        """
-        return self._cdp.bring_to_front()
-
-    def get_active_element(self) -> Any:
-        """
-        Retrieve the currently active element on the page.
-
-        Returns:
-            Any: The active element.
-        """
-        return self._cdp.get_active_element()
-
-    def get_active_element_css(self) -> str:
-        """
-        Get the computed CSS of the currently active element.
-
-        Returns:
-            str: A string representation of the active element's CSS.
-        """
-        return self._cdp.get_active_element_css()
-
     def click(self, selector: str, timeout: Optional[int] = None) -> None:
         """
         Click an element specified by the CSS selector.
@@ -432,8 +1101,11 @@ class CDPWrapper:
             selector (str): The CSS selector for the element.
             timeout (Optional[int]): Timeout in seconds.
         """
+        self._invalidate_selector_cache()
         return self._cdp.click(selector, timeout)
 
+    mouse_click = click
+
     def click_active_element(self) -> None:
         """
         Click on the element that is currently active.
@@ -441,6 +1113,7 @@ class CDPWrapper:
         Returns:
             None
         """
+        self._invalidate_selector_cache()
         return self._cdp.click_active_element()
 
     def click_if_visible(self, selector: str) -> bool:
@@ -453,6 +1126,18 @@ class CDPWrapper:
         Returns:
             bool: True if the element was visible and clicked; otherwise, False.
         """
+        self._invalidate_selector_cache()
+        if self._is_plain_css(selector):
+            try:
+                return bool(
+                    self._cdp.evaluate(
+                        _render_js(
+                            _JS_CLICK_IF_VISIBLE, self._js_selector(selector)
+                        )
+                    )
+                )
+            except Exception:
+                pass
         return self._cdp.click_if_visible(selector)
 
     def click_visible_elements(self, selector: str, limit: int = 0) -> int:
@@ -466,6 +1151,24 @@ class CDPWrapper:
         Returns:
             int: The number of elements clicked.
         """
+        self._invalidate_selector_cache()
+        if self._is_plain_css(selector):
+            try:
+                limit_js = str(int(limit))
+                count = self._cdp.evaluate(
+                    _render_js(
+                        _JS_CLICK_VISIBLE,
+                        self._js_selector(selector),
+                        limit_js,
+                        limit_js,
+                    )
+                )
+                if count:
+                    return count
+                # Nothing matched yet: let the underlying path wait
+                # for the elements (or raise) as documented.
+            except Exception:
+                pass
         return self._cdp.click_visible_elements(selector, limit)
 
     def nested_click(self, parent_selector: str, selector: str) -> None:
@@ -476,21 +1179,24 @@ class CDPWrapper:
             parent_selector (str): The CSS selector for the parent element.
             selector (str): The CSS selector for the nested element.
         """
+        self._invalidate_selector_cache()
+        if self._is_plain_css(parent_selector) and self._is_plain_css(selector):
+            try:
+                clicked = self._cdp.evaluate(
+                    _render_js(
+                        _JS_NESTED_CLICK,
+                        self._js_selector(parent_selector),
+                        self._js_selector(selector),
+                    )
+                )
+                if clicked:
+                    return None
+            except Exception:
+                pass
+        # Iframes and not-yet-present elements take the underlying
+        # path, which resolves the child through the element handle.
         return self._cdp.nested_click(parent_selector, selector)
 
-    def get_nested_element(self, parent_selector: str, selector: str) -> Any:
-        """
-        Retrieve a nested element given a parent and child CSS selector.
-
-        Args:
-            parent_selector (str): The CSS selector for the parent element.
-            selector (str): The CSS selector for the nested element.
-
-        Returns:
-            Any: The found nested element.
-        """
-        return self._cdp.get_nested_element(parent_selector, selector)
-
     def select_option_by_text(self, dropdown_selector: str, option: str) -> None:
         """
         Select an option from a dropdown element by matching its visible text.
@@ -499,78 +1205,277 @@ class CDPWrapper:
             dropdown_selector (str): The CSS selector for the dropdown.
             option (str): The visible text of the option to select.
         """
+        self._invalidate_selector_cache()
+        if self._is_plain_css(dropdown_selector):
+            try:
+                selected = self._cdp.evaluate(
+                    _render_js(
+                        _JS_SELECT_OPTION_BY_TEXT,
+                        self._js_selector(dropdown_selector),
+                        _json_dumps(option.strip()),
+                    )
+                )
+                if selected:
+                    return None
+            except Exception:
+                pass
         return self._cdp.select_option_by_text(dropdown_selector, option)
 
-    def flash(
-        self, selector: str, duration: int = 1, color: str = "44CC88", pause: int = 0
-    ) -> None:
+    def _cached_sel_eval(
+        self, selector: str, found_js: str, missing_js: str
+    ) -> Any:
+        """Evaluate against the in-page cached querySelector result."""
+        return self._cdp.evaluate(
+            _render_js(
+                _JS_SEL_CACHE_QUERY,
+                self._js_selector(selector),
+                found_js,
+                missing_js,
+            )
+        )
+
+    def is_element_present(self, selector: str) -> bool:
         """
-        Flash an element by temporarily changing its style.
+        Check if an element exists in the DOM.
 
         Args:
             selector (str): The CSS selector for the element.
-            duration (int): Duration in seconds for which to flash.
-            color (str): The flash color (default "44CC88").
-            pause (int): Pause time between flashes in seconds.
+
+        Returns:
+            bool: True if the element is present, otherwise False.
         """
-        return self._cdp.flash(selector, duration, color, pause)
+        if self._is_plain_css(selector):
+            try:
+                return bool(
+                    self._cached_sel_eval(selector, "true", "false")
+                )
+            except Exception:
+                pass
+        return self._cdp.is_element_present(selector)
 
-    def highlight(self, selector: str) -> None:
+    def get_element_html(self, selector: str) -> str:
         """
-        Highlight an element on the page.
+        Retrieve the HTML content of an element.
 
         Args:
             selector (str): The CSS selector for the element.
+
+        Returns:
+            str: The HTML string of the element.
         """
-        return self._cdp.highlight(selector)
+        if self._is_plain_css(selector):
+            try:
+                html = self._cached_sel_eval(
+                    selector, "e.outerHTML", "null"
+                )
+                if html is not None:
+                    return html
+            except Exception:
+                pass
+        return self._cdp.get_element_html(selector)
 
-    def focus(self, selector: str) -> None:
+    def get_element_attributes(self, selector: str) -> Dict[str, str]:
         """
-        Set focus to a specific element.
+        Retrieve all attributes for an element.
 
         Args:
             selector (str): The CSS selector for the element.
+
+        Returns:
+            Dict[str, str]: A dictionary of attribute names and values.
         """
-        return self._cdp.focus(selector)
+        if self._is_plain_css(selector):
+            try:
+                attrs = self._cached_sel_eval(
+                    selector,
+                    "(() => { const o = {};"
+                    " for (const a of e.attributes) o[a.name] = a.value;"
+                    " return o; })()",
+                    "null",
+                )
+                if attrs is not None:
+                    return attrs
+            except Exception:
+                pass
+        return self._cdp.get_element_attributes(selector)
 
-    def highlight_overlay(self, selector: str) -> None:
+    def assert_all(self, selectors: List[str], timeout: Optional[float] = None) -> None:
         """
-        Highlight an element using an overlay effect.
+        Assert that every selector in the list matches an element.
+
+        All selectors are checked with a single Runtime.evaluate (one
+        round-trip however many there are), retrying until the timeout.
 
         Args:
-            selector (str): The CSS selector for the element.
+            selectors (List[str]): CSS selectors that must all match.
+            timeout (Optional[float]): Seconds to keep retrying.
+
+        Raises:
+            AssertionError: Naming the selectors that never matched.
+        """
+        if not all(self._is_plain_css(sel) for sel in selectors):
+            for sel in selectors:
+                self._cdp.assert_element_present(sel, timeout)
+            return
+        payload = _selector_list_js(tuple(selectors))
+        if self._wait_predicate(_JS_PRESENT_ALL % payload, timeout):
+            return
+        try:
+            present = self._cdp.evaluate(_JS_PRESENT_MAP % payload)
+            missing = [
+                sel for sel, ok in zip(selectors, present) if not ok
+            ]
+        except Exception:
+            missing = list(selectors)
+        raise AssertionError(
+            "Elements not found: {%s}" % ", ".join(missing)
+        )
+
+    def wait_for_all(
+        self, selectors: List[str], timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Wait until every selector in the list matches an element.
+
+        One batched predicate is polled instead of one round-trip per
+        selector per tick.
+
+        Args:
+            selectors (List[str]): CSS selectors that must all match.
+            timeout (Optional[float]): Seconds before giving up.
+
+        Returns:
+            bool: True if all matched before the timeout.
         """
-        return self._cdp.highlight_overlay(selector)
+        if not all(self._is_plain_css(sel) for sel in selectors):
+            try:
+                for sel in selectors:
+                    self._cdp.assert_element_present(sel, timeout)
+                return True
+            except Exception:
+                return False
+        payload = _selector_list_js(tuple(selectors))
+        return self._wait_predicate(_JS_PRESENT_ALL % payload, timeout)
 
-    def get_parent(self, element: Any) -> Any:
+    def find_all_text(self, selector: str) -> List[str]:
         """
-        Get the parent element of a given element.
+        Retrieve the innerText of every element matching the selector.
+
+        The iteration happens in the page, so N elements cost one CDP
+        round-trip instead of one per element.
 
         Args:
-            element (Any): The element whose parent is needed.
+            selector (str): The CSS selector for the elements.
 
         Returns:
-            Any: The parent element.
+            List[str]: The text of each matching element, in DOM order.
         """
-        return self._cdp.get_parent(element)
+        # evaluate() returns None for falsy values, so an empty match
+        # list must be normalized back to the documented type.
+        return (
+            self._cdp.evaluate(
+                _render_js(_JS_ALL_TEXT, self._js_selector(selector))
+            )
+            or []
+        )
 
-    def remove_element(self, selector: str) -> None:
+    def find_all_attribute(self, selector: str, attribute: str) -> List[Optional[str]]:
         """
-        Remove an element from the DOM based on its CSS selector.
+        Retrieve one attribute from every element matching the selector.
+
+        Args:
+            selector (str): The CSS selector for the elements.
+            attribute (str): The attribute name to read.
+
+        Returns:
+            List[Optional[str]]: Attribute values in DOM order (None
+            where the attribute is missing).
+        """
+        return (
+            self._cdp.evaluate(
+                _render_js(
+                    _JS_ALL_ATTRIBUTE,
+                    self._js_selector(selector),
+                    _json_dumps(attribute),
+                )
+            )
+            or []
+        )
+
+    def get_many(self, selectors: Dict[str, str]) -> Dict[str, Optional[str]]:
+        """
+        Read the textContent of several selectors in one CDP call.
+
+        Args:
+            selectors (Dict[str, str]): Mapping of result keys to CSS
+                selectors.
+
+        Returns:
+            Dict[str, Optional[str]]: Text per key (None where no
+            element matches).
+        """
+        return (
+            self._cdp.evaluate(_JS_GET_MANY % _json_dumps(selectors)) or {}
+        )
+
+    def set_attributes_many(self, triples: List[Tuple[str, str, str]]) -> int:
+        """
+        Apply several (selector, attribute, value) updates in one call.
+
+        Form-heavy flows set many attributes back to back; one script
+        applies them all instead of a round-trip per triple.
+
+        Args:
+            triples (List[Tuple[str, str, str]]): (selector, attribute,
+                value) updates, applied in order.
+
+        Returns:
+            int: How many selectors matched and were updated.
+        """
+        self._invalidate_selector_cache()
+        # evaluate() maps a falsy 0 to None; keep the documented int.
+        return (
+            self._cdp.evaluate(
+                _JS_SET_ATTRIBUTES_MANY
+                % _json_dumps([list(t) for t in triples])
+            )
+            or 0
+        )
+
+    def get_element_path(self, selector: str) -> Optional[List[int]]:
+        """
+        Resolve an element to its ancestor-index path from documentElement.
+
+        The path (e.g. [3, 1, 0, 7]) is computed with one DOM walk in a
+        single CDP call and is far cheaper than synthesizing a unique
+        CSS selector on large pages, while still identifying the node
+        stably for reports and re-lookup.
 
         Args:
             selector (str): The CSS selector for the element.
+
+        Returns:
+            Optional[List[int]]: Child indices from the root down to
+            the element, or None if no element matches.
         """
-        return self._cdp.remove_element(selector)
+        result = self._cdp.evaluate(
+            _render_js(_JS_ELEMENT_PATH, self._js_selector(selector))
+        )
+        if not result:
+            return None
+        return result["p"]
 
-    def remove_from_dom(self, selector: str) -> None:
+    def remove_element(self, selector: str) -> None:
         """
-        Remove an element from the DOM (alias for remove_element).
+        Remove an element from the DOM based on its CSS selector.
 
         Args:
             selector (str): The CSS selector for the element.
         """
-        return self._cdp.remove_from_dom(selector)
+        self._invalidate_selector_cache()
+        return self._cdp.remove_element(selector)
+
+    remove_from_dom = remove_element
 
     def remove_elements(self, selector: str) -> None:
         """
@@ -579,6 +1484,7 @@ class CDPWrapper:
         Args:
             selector (str): The CSS selector for the elements.
         """
+        self._invalidate_selector_cache()
         return self._cdp.remove_elements(selector)
 
     def send_keys(
@@ -592,6 +1498,7 @@ class CDPWrapper:
             text (str): The text or keys to send.
             timeout (Optional[int]): Timeout in seconds.
         """
+        self._invalidate_selector_cache()
         return self._cdp.send_keys(selector, text, timeout)
 
     def press_keys(
@@ -605,6 +1512,7 @@ class CDPWrapper:
             text (str): The keys to press.
             timeout (Optional[int]): Timeout in seconds.
         """
+        self._invalidate_selector_cache()
         return self._cdp.press_keys(selector, text, timeout)
 
     def set_value(
@@ -618,689 +1526,407 @@ class CDPWrapper:
             text (str): The value to set.
             timeout (Optional[int]): Timeout in seconds.
         """
+        self._invalidate_selector_cache()
         return self._cdp.set_value(selector, text, timeout)
 
-    def evaluate(self, expression: str) -> Any:
+    def get_element_rect(
+        self, selector: str, timeout: Optional[int] = None
+    ) -> Dict[str, int]:
         """
-        Evaluate a JavaScript expression in the context of the current page.
+        Retrieve the rectangle (position and size) of an element.
 
         Args:
-            expression (str): The JavaScript expression to evaluate.
+            selector (str): The CSS selector for the element.
+            timeout (Optional[int]): Timeout in seconds.
 
         Returns:
-            Any: The result of the evaluation.
+            Dict[str, int]: A dictionary with element x, y, width, and height.
         """
-        return self._cdp.evaluate(expression)
+        try:
+            rect = self._cdp.evaluate(
+                _render_js(_JS_RECT, self._js_selector(selector))
+            )
+        except Exception:
+            rect = None
+        if rect:
+            return rect
+        # XPath selectors and not-yet-present elements take the
+        # underlying waiting path.
+        return self._cdp.get_element_rect(selector, timeout=timeout)
 
-    def js_dumps(self, obj_name: str) -> str:
+    def get_element_size(
+        self, selector: str, timeout: Optional[int] = None
+    ) -> Dict[str, int]:
         """
-        Dump a JavaScript object as a string.
+        Retrieve the size (width and height) of an element.
 
         Args:
-            obj_name (str): The name of the JavaScript object.
+            selector (str): The CSS selector for the element.
+            timeout (Optional[int]): Timeout in seconds.
 
         Returns:
-            str: A string representation of the JavaScript object.
+            Dict[str, int]: A dictionary with element width and height.
         """
-        return self._cdp.js_dumps(obj_name)
+        rect = self.get_element_rect(selector, timeout=timeout)
+        return {"width": rect["width"], "height": rect["height"]}
 
-    def maximize(self) -> None:
-        """
-        Maximize the browser window.
+    def get_element_position(
+        self, selector: str, timeout: Optional[int] = None
+    ) -> Dict[str, int]:
         """
-        return self._cdp.maximize()
+        Retrieve the position (x and y coordinates) of an element.
 
-    def minimize(self) -> None:
-        """
-        Minimize the browser window.
-        """
-        return self._cdp.minimize()
+        Args:
+            selector (str): The CSS selector for the element.
+            timeout (Optional[int]): Timeout in seconds.
 
-    def medimize(self) -> None:
-        """
-        Set the browser window to a medium size.
+        Returns:
+            Dict[str, int]: A dictionary with element x and y coordinates.
         """
-        return self._cdp.medimize()
+        rect = self.get_element_rect(selector, timeout=timeout)
+        return {"x": rect["x"], "y": rect["y"]}
 
-    def set_window_rect(
-        self,
-        x: Optional[int] = None,
-        y: Optional[int] = None,
-        width: Optional[int] = None,
-        height: Optional[int] = None,
-    ) -> None:
+    def get_gui_element_center(
+        self, selector: str, timeout: Optional[int] = None
+    ) -> Tuple[int, int]:
         """
-        Set the dimensions and position of the browser window.
+        Retrieve the center coordinates of a GUI element.
 
         Args:
-            x (Optional[int]): The x-coordinate for the window.
-            y (Optional[int]): The y-coordinate for the window.
-            width (Optional[int]): The width of the window.
-            height (Optional[int]): The height of the window.
-        """
-        return self._cdp.set_window_rect(x=x, y=y, width=width, height=height)
+            selector (str): The CSS selector for the GUI element.
+            timeout (Optional[int]): Timeout in seconds.
 
-    def reset_window_size(self) -> None:
-        """
-        Reset the browser window to its default size.
+        Returns:
+            Tuple[int, int]: A tuple with the x and y coordinates of the element's center.
         """
-        return self._cdp.reset_window_size()
+        rect = self._cdp.get_gui_element_rect(selector, timeout=timeout)
+        return (
+            (rect["x"] + rect["width"] / 2.0) + 0.5,
+            (rect["y"] + rect["height"] / 2.0) + 0.5,
+        )
 
-    def open_new_window(self, url: Optional[str] = None, switch_to: bool = True) -> Any:
+    def check_if_unchecked(self, selector: str) -> bool:
         """
-        Open a new browser window and optionally switch focus to it.
+        If a checkbox or radio button is unchecked, check it.
 
         Args:
-            url (Optional[str]): An optional URL to open in the new window.
-            switch_to (bool): If True, switch focus to the new window (default is True).
+            selector (str): The CSS selector for the element.
 
         Returns:
-            Any: The handle of the new window.
+            bool: True if the element was unchecked and has now been checked; otherwise, False.
         """
-        return self._cdp.open_new_window(url=url, switch_to=switch_to)
+        self._invalidate_selector_cache()
+        if self._is_plain_css(selector):
+            try:
+                toggled = self._cdp.evaluate(
+                    _render_js(
+                        _JS_TOGGLE_IF, self._js_selector(selector), "true"
+                    )
+                )
+                if toggled is not None:
+                    return bool(toggled)
+            except Exception:
+                pass
+        return self._cdp.check_if_unchecked(selector)
 
-    def switch_to_window(self, window: Union[str, int]) -> None:
+    def select_if_unselected(self, selector: str) -> bool:
         """
-        Switch focus to a specific browser window.
+        If an element is not already selected, select it.
 
         Args:
-            window (Union[str, int]): The window handle or index.
-        """
-        return self._cdp.switch_to_window(window)
+            selector (str): The CSS selector for the element.
 
-    def switch_to_newest_window(self) -> None:
-        """
-        Switch focus to the most recently opened browser window.
+        Returns:
+            bool: True if the element was unselected and is now selected; otherwise, False.
         """
-        return self._cdp.switch_to_newest_window()
+        self._invalidate_selector_cache()
+        if self._is_plain_css(selector):
+            try:
+                toggled = self._cdp.evaluate(
+                    _render_js(
+                        _JS_TOGGLE_IF, self._js_selector(selector), "true"
+                    )
+                )
+                if toggled is not None:
+                    return bool(toggled)
+            except Exception:
+                pass
+        return self._cdp.select_if_unselected(selector)
 
-    def open_new_tab(self, url: Optional[str] = None, switch_to: bool = True) -> Any:
+    def uncheck_if_checked(self, selector: str) -> bool:
         """
-        Open a new browser tab and optionally switch focus to it.
+        Uncheck a checkbox or radio button if it is currently checked.
 
         Args:
-            url (Optional[str]): An optional URL to open in the new tab.
-            switch_to (bool): If True, switch focus to the new tab (default is True).
+            selector (str): The CSS selector for the element.
 
         Returns:
-            Any: The handle of the new tab.
+            bool: True if the element was checked and has now been unchecked; otherwise, False.
         """
-        return self._cdp.open_new_tab(url=url, switch_to=switch_to)
+        self._invalidate_selector_cache()
+        if self._is_plain_css(selector):
+            try:
+                toggled = self._cdp.evaluate(
+                    _render_js(
+                        _JS_TOGGLE_IF, self._js_selector(selector), "false"
+                    )
+                )
+                if toggled is not None:
+                    return bool(toggled)
+            except Exception:
+                pass
+        return self._cdp.uncheck_if_checked(selector)
 
-    def switch_to_tab(self, tab: Union[str, int]) -> None:
+    def unselect_if_selected(self, selector: str) -> bool:
         """
-        Switch focus to a specific browser tab.
+        Unselect an element if it is currently selected.
 
         Args:
-            tab (Union[str, int]): The tab handle or index.
-        """
-        return self._cdp.switch_to_tab(tab)
-
-    def switch_to_newest_tab(self) -> None:
-        """
-        Switch focus to the most recently opened browser tab.
-        """
-        return self._cdp.switch_to_newest_tab()
+            selector (str): The CSS selector for the element.
 
-    def close_active_tab(self) -> None:
-        """
-        Close the currently active browser tab.
+        Returns:
+            bool: True if the element was selected and has now been unselected; otherwise, False.
         """
-        return self._cdp.close_active_tab()
+        self._invalidate_selector_cache()
+        if self._is_plain_css(selector):
+            try:
+                toggled = self._cdp.evaluate(
+                    _render_js(
+                        _JS_TOGGLE_IF, self._js_selector(selector), "false"
+                    )
+                )
+                if toggled is not None:
+                    return bool(toggled)
+            except Exception:
+                pass
+        return self._cdp.unselect_if_selected(selector)
 
-    def get_active_tab(self) -> str:
+    def assert_element_visible(
+        self, selector: str, timeout: Optional[int] = None
+    ) -> bool:
         """
-        Get the handle of the currently active tab.
+        Assert that an element is visible.
 
-        Returns:
-            str: The active tab handle.
-        """
-        return self._cdp.get_active_tab()
+        The overwhelmingly common passing case is settled with one
+        boolean probe and no message formatting; only a miss takes the
+        underlying waiting path, which owns the canonical error.
 
-    def get_tabs(self) -> List[str]:
-        """
-        Retrieve handles for all open tabs.
+        Args:
+            selector (str): The CSS selector for the element.
+            timeout (Optional[int]): Maximum time to wait in seconds.
 
-        Returns:
-            List[str]: A list of all tab handles.
-        """
-        return self._cdp.get_tabs()
+        Raises:
+            Exception: If the element is not visible within the timeout.
+        """
+        if self._is_plain_css(selector):
+            try:
+                if self._cdp.evaluate(
+                    _render_js(_JS_VISIBLE, self._js_selector(selector))
+                ):
+                    return True
+            except Exception:
+                pass
+        return self._cdp.assert_element_visible(selector, timeout)
 
-    def get_window(self) -> str:
-        """
-        Get the handle of the currently active window.
+    # Same as assert_element_visible() upstream.
+    assert_element = assert_element_visible
 
-        Returns:
-            str: The active window handle.
+    def assert_element_present(
+        self, selector: str, timeout: Optional[int] = None
+    ) -> bool:
         """
-        return self._cdp.get_window()
+        Assert that an element is present in the DOM.
 
-    def get_text(self, selector: str) -> str:
-        """
-        Retrieve the text content of an element.
+        One boolean probe settles the passing case; misses delegate to
+        the underlying waiting assert.
 
         Args:
             selector (str): The CSS selector for the element.
+            timeout (Optional[int]): Maximum time to wait in seconds.
 
-        Returns:
-            str: The text contained within the element.
-        """
-        return self._cdp.get_text(selector)
+        Raises:
+            Exception: If the element is not present within the timeout.
+        """
+        if self._is_plain_css(selector):
+            try:
+                if self._cdp.evaluate(
+                    _render_js(_JS_PRESENT, self._js_selector(selector))
+                ):
+                    return True
+            except Exception:
+                pass
+        return self._cdp.assert_element_present(selector, timeout)
 
-    def get_title(self) -> str:
-        """
-        Retrieve the title of the current page.
+    def _text_probe(self, selector: str, text: str, exact: bool) -> str:
+        """Build the JS probe that checks text browser-side.
 
-        Returns:
-            str: The page title.
+        Only a boolean crosses the websocket, never the page text.
         """
-        return self._cdp.get_title()
+        template = _JS_TEXT_EXACT if exact else _JS_TEXT_VISIBLE
+        return _render_js(
+            template, self._js_selector(selector), _json_dumps(text.strip())
+        )
 
-    def get_current_url(self) -> str:
+    def is_text_visible(self, text: str, selector: str = "body") -> bool:
         """
-        Retrieve the URL of the current page.
+        Check if a specific text is visible on the page.
+
+        Args:
+            text (str): The text to check for.
+            selector (str): The CSS selector within which to search (default is "body").
 
         Returns:
-            str: The current page URL.
+            bool: True if the text is visible, otherwise False.
         """
-        return self._cdp.get_current_url()
+        if self._is_plain_css(selector):
+            try:
+                return bool(
+                    self._cdp.evaluate(self._text_probe(selector, text, False))
+                )
+            except Exception:
+                pass
+        return self._cdp.is_text_visible(text, selector)
 
-    def get_origin(self) -> str:
+    def is_exact_text_visible(self, text: str, selector: str = "body") -> bool:
         """
-        Retrieve the origin (protocol + domain) of the current page.
+        Check if an exact text string is visible on the page.
+
+        Args:
+            text (str): The exact text to check for.
+            selector (str): The CSS selector within which to search (default is "body").
 
         Returns:
-            str: The origin string.
+            bool: True if the exact text is visible, otherwise False.
         """
-        return self._cdp.get_origin()
+        if self._is_plain_css(selector):
+            try:
+                return bool(
+                    self._cdp.evaluate(self._text_probe(selector, text, True))
+                )
+            except Exception:
+                pass
+        return self._cdp.is_exact_text_visible(text, selector)
 
-    def get_page_source(self) -> str:
+    def assert_text(
+        self, text: str, selector: str = "html", timeout: Optional[int] = None
+    ) -> bool:
         """
-        Retrieve the full HTML source of the current page.
+        Assert that the given text appears within the specified element.
 
-        Returns:
-            str: The HTML source code.
-        """
-        return self._cdp.get_page_source()
+        Args:
+            text (str): The text to look for.
+            selector (str): The CSS selector for the element (default "html").
+            timeout (Optional[int]): Maximum time to wait in seconds.
 
-    def get_user_agent(self) -> str:
+        Raises:
+            AssertionError: If the text does not appear within the timeout.
         """
-        Retrieve the user agent string of the browser.
+        self.wait_for_text(text, selector, timeout)
+        return True
 
-        Returns:
-            str: The user agent.
+    def assert_exact_text(
+        self, text: str, selector: str = "html", timeout: Optional[int] = None
+    ) -> bool:
         """
-        return self._cdp.get_user_agent()
+        Assert that the given exact text appears within the specified element.
 
-    def get_cookie_string(self) -> str:
-        """
-        Retrieve all cookies as a single string.
+        Args:
+            text (str): The exact text to match.
+            selector (str): The CSS selector for the element (default "html").
+            timeout (Optional[int]): Maximum time to wait in seconds.
 
-        Returns:
-            str: The concatenated cookie string.
+        Raises:
+            AssertionError: If the exact text does not appear within the timeout.
         """
-        return self._cdp.get_cookie_string()
+        if self._is_plain_css(selector):
+            predicate = _render_js(
+                _JS_TEXT_EXACT_VISIBLE,
+                self._js_selector(selector),
+                _json_dumps(text.strip()),
+            )
+            if self._wait_predicate(predicate, timeout):
+                return True
+            return self._cdp.assert_exact_text(text, selector, 0.1)
+        return self._cdp.assert_exact_text(text, selector, timeout)
 
-    def get_locale_code(self) -> str:
+    def wait_for_text(
+        self, text: str, selector: str = "body", timeout: Optional[int] = None
+    ) -> bool:
         """
-        Retrieve the locale code used by the browser.
+        Wait until a specific text appears on the page.
+
+        Args:
+            text (str): The text to wait for.
+            selector (str): The CSS selector within which to check (default is "body").
+            timeout (Optional[int]): Maximum time to wait in seconds.
 
         Returns:
-            str: The locale code.
+            bool: True if the text appears before the timeout, otherwise False.
         """
-        return self._cdp.get_locale_code()
+        if not self._is_plain_css(selector):
+            return self._cdp.wait_for_text(text, selector, timeout)
+        text = text.strip()
+        predicate = _render_js(
+            _JS_TEXT_VISIBLE, self._js_selector(selector), _json_dumps(text)
+        )
+        if self._wait_predicate(predicate, timeout):
+            return True
+        return self._cdp.wait_for_text(text, selector, 0.1)
 
-    def get_screen_rect(self) -> Dict[str, int]:
+    def wait_for_text_not_visible(
+        self, text: str, selector: str = "body", timeout: Optional[int] = None
+    ) -> bool:
         """
-        Retrieve the dimensions of the screen.
+        Wait until a specific text disappears from the page.
+
+        Args:
+            text (str): The text to wait to disappear.
+            selector (str): The CSS selector within which to check (default is "body").
+            timeout (Optional[int]): Maximum time to wait in seconds.
 
         Returns:
-            Dict[str, int]: A dictionary with screen width and height.
+            bool: True if the text is no longer visible before the timeout, otherwise False.
         """
-        return self._cdp.get_screen_rect()
+        if not self._is_plain_css(selector):
+            return self._cdp.wait_for_text_not_visible(text, selector, timeout)
+        text = text.strip()
+        predicate = "!(%s)" % _render_js(
+            _JS_TEXT_VISIBLE, self._js_selector(selector), _json_dumps(text)
+        )
+        if self._wait_predicate(predicate, timeout):
+            return True
+        timeout = timeout or settings.SMALL_TIMEOUT
+        plural = "" if timeout == 1 else "s"
+        raise Exception(
+            "Text {%s} in {%s} was still visible after %s second%s!"
+            % (text, selector, timeout, plural)
+        )
 
-    def get_window_rect(self) -> Dict[str, int]:
+    def wait_for_element_visible(
+        self, selector: str, timeout: Optional[int] = None
+    ) -> bool:
         """
-        Retrieve the dimensions and position of the browser window.
+        Wait until an element becomes visible.
+
+        Args:
+            selector (str): The CSS selector for the element.
+            timeout (Optional[int]): Maximum time to wait in seconds.
 
         Returns:
-            Dict[str, int]: A dictionary with window x, y, width, and height.
+            bool: True if the element becomes visible before the timeout, otherwise False.
         """
-        return self._cdp.get_window_rect()
+        if not self._is_plain_css(selector):
+            return self._cdp.wait_for_element_visible(selector, timeout)
+        predicate = _render_js(_JS_VISIBLE, self._js_selector(selector))
+        if self._wait_predicate(predicate, timeout):
+            return self.find_element(selector)
+        return self._cdp.wait_for_element_visible(selector, 0.1)
 
-    def get_window_size(self) -> Dict[str, int]:
+    def wait_for_element_not_visible(
+        self, selector: str, timeout: Optional[int] = None
+    ) -> bool:
         """
-        Retrieve the size (width and height) of the browser window.
-
-        Returns:
-            Dict[str, int]: A dictionary with window width and height.
-        """
-        return self._cdp.get_window_size()
-
-    def get_window_position(self) -> Dict[str, int]:
-        """
-        Retrieve the position (x and y coordinates) of the browser window.
-
-        Returns:
-            Dict[str, int]: A dictionary with window x and y positions.
-        """
-        return self._cdp.get_window_position()
-
-    def get_element_rect(
-        self, selector: str, timeout: Optional[int] = None
-    ) -> Dict[str, int]:
-        """
-        Retrieve the rectangle (position and size) of an element.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            timeout (Optional[int]): Timeout in seconds.
-
-        Returns:
-            Dict[str, int]: A dictionary with element x, y, width, and height.
-        """
-        return self._cdp.get_element_rect(selector, timeout=timeout)
-
-    def get_element_size(
-        self, selector: str, timeout: Optional[int] = None
-    ) -> Dict[str, int]:
-        """
-        Retrieve the size (width and height) of an element.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            timeout (Optional[int]): Timeout in seconds.
-
-        Returns:
-            Dict[str, int]: A dictionary with element width and height.
-        """
-        return self._cdp.get_element_size(selector, timeout=timeout)
-
-    def get_element_position(
-        self, selector: str, timeout: Optional[int] = None
-    ) -> Dict[str, int]:
-        """
-        Retrieve the position (x and y coordinates) of an element.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            timeout (Optional[int]): Timeout in seconds.
-
-        Returns:
-            Dict[str, int]: A dictionary with element x and y coordinates.
-        """
-        return self._cdp.get_element_position(selector, timeout=timeout)
-
-    def get_gui_element_rect(
-        self, selector: str, timeout: Optional[int] = None
-    ) -> Dict[str, int]:
-        """
-        Retrieve the rectangle dimensions of a GUI element.
-
-        Args:
-            selector (str): The CSS selector for the GUI element.
-            timeout (Optional[int]): Timeout in seconds.
-
-        Returns:
-            Dict[str, int]: A dictionary with GUI element dimensions.
-        """
-        return self._cdp.get_gui_element_rect(selector, timeout=timeout)
-
-    def get_gui_element_center(
-        self, selector: str, timeout: Optional[int] = None
-    ) -> Tuple[int, int]:
-        """
-        Retrieve the center coordinates of a GUI element.
-
-        Args:
-            selector (str): The CSS selector for the GUI element.
-            timeout (Optional[int]): Timeout in seconds.
-
-        Returns:
-            Tuple[int, int]: A tuple with the x and y coordinates of the element's center.
-        """
-        return self._cdp.get_gui_element_center(selector, timeout=timeout)
-
-    def get_document(self) -> Dict[str, Any]:
-        """
-        Retrieve the full document object of the current page.
-
-        Returns:
-            Dict[str, Any]: A dictionary representing the document.
-        """
-        return self._cdp.get_document()
-
-    def get_flattened_document(self) -> Dict[str, Any]:
-        """
-        Retrieve a flattened version of the document object.
-
-        Returns:
-            Dict[str, Any]: A dictionary representing the flattened document.
-        """
-        return self._cdp.get_flattened_document()
-
-    def get_element_attributes(self, selector: str) -> Dict[str, str]:
-        """
-        Retrieve all attributes for an element.
-
-        Args:
-            selector (str): The CSS selector for the element.
-
-        Returns:
-            Dict[str, str]: A dictionary of attribute names and values.
-        """
-        return self._cdp.get_element_attributes(selector)
-
-    def get_element_attribute(self, selector: str, attribute: str) -> str:
-        """
-        Retrieve a specific attribute's value from an element.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            attribute (str): The attribute name.
-
-        Returns:
-            str: The value of the attribute.
-        """
-        return self._cdp.get_element_attribute(selector, attribute)
-
-    def get_element_html(self, selector: str) -> str:
-        """
-        Retrieve the HTML content of an element.
-
-        Args:
-            selector (str): The CSS selector for the element.
-
-        Returns:
-            str: The HTML string of the element.
-        """
-        return self._cdp.get_element_html(selector)
-
-    def set_locale(self, locale: str) -> None:
-        """
-        Set the browser's locale.
-
-        Args:
-            locale (str): The locale code to set (e.g., "en-US").
-        """
-        return self._cdp.set_locale(locale)
-
-    def set_attributes(self, selector: str, attribute: str, value: str) -> None:
-        """
-        Set a specific attribute to a new value for an element.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            attribute (str): The attribute name.
-            value (str): The new value to set.
-        """
-        return self._cdp.set_attributes(selector, attribute, value)
-
-    def gui_press_key(self, key: str) -> None:
-        """
-        Simulate pressing a single key using GUI automation.
-
-        Args:
-            key (str): The key to press.
-        """
-        return self._cdp.gui_press_key(key)
-
-    def gui_press_keys(self, keys: str) -> None:
-        """
-        Simulate pressing multiple keys using GUI automation.
-
-        Args:
-            keys (str): A string representing the keys to press.
-        """
-        return self._cdp.gui_press_keys(keys)
-
-    def gui_write(self, text: str) -> None:
-        """
-        Write text using GUI automation.
-
-        Args:
-            text (str): The text to write.
-        """
-        return self._cdp.gui_write(text)
-
-    def gui_click_x_y(self, x: int, y: int) -> None:
-        """
-        Click on the screen at the specified x and y coordinates using GUI automation.
-
-        Args:
-            x (int): The x-coordinate.
-            y (int): The y-coordinate.
-        """
-        return self._cdp.gui_click_x_y(x, y)
-
-    def gui_click_element(self, selector: str) -> None:
-        """
-        Click an element using GUI automation based on its CSS selector.
-
-        Args:
-            selector (str): The CSS selector for the element.
-        """
-        return self._cdp.gui_click_element(selector)
-
-    def gui_drag_drop_points(self, x1: int, y1: int, x2: int, y2: int) -> None:
-        """
-        Perform a drag-and-drop action from one point to another using GUI automation.
-
-        Args:
-            x1 (int): The starting x-coordinate.
-            y1 (int): The starting y-coordinate.
-            x2 (int): The ending x-coordinate.
-            y2 (int): The ending y-coordinate.
-        """
-        return self._cdp.gui_drag_drop_points(x1, y1, x2, y2)
-
-    def gui_drag_and_drop(self, drag_selector: str, drop_selector: str) -> None:
-        """
-        Drag an element and drop it onto another element using GUI automation.
-
-        Args:
-            drag_selector (str): The CSS selector for the element to drag.
-            drop_selector (str): The CSS selector for the target element.
-        """
-        return self._cdp.gui_drag_and_drop(drag_selector, drop_selector)
-
-    def gui_hover_x_y(self, x: int, y: int) -> None:
-        """
-        Hover over the screen at the specified coordinates using GUI automation.
-
-        Args:
-            x (int): The x-coordinate.
-            y (int): The y-coordinate.
-        """
-        return self._cdp.gui_hover_x_y(x, y)
-
-    def gui_hover_element(self, selector: str) -> None:
-        """
-        Hover over an element using its CSS selector with GUI automation.
-
-        Args:
-            selector (str): The CSS selector for the element.
-        """
-        return self._cdp.gui_hover_element(selector)
-
-    def gui_hover_and_click(self, hover_selector: str, click_selector: str) -> None:
-        """
-        Hover over one element and then click on another element using GUI automation.
-
-        Args:
-            hover_selector (str): The CSS selector for the element to hover over.
-            click_selector (str): The CSS selector for the element to click.
-        """
-        return self._cdp.gui_hover_and_click(hover_selector, click_selector)
-
-    def internalize_links(self) -> None:
-        """
-        Modify all links on the page so that they open in the current window instead of a new tab/window.
-        """
-        return self._cdp.internalize_links()
-
-    def is_checked(self, selector: str) -> bool:
-        """
-        Check whether a checkbox or radio button is checked.
-
-        Args:
-            selector (str): The CSS selector for the element.
-
-        Returns:
-            bool: True if the element is checked, otherwise False.
-        """
-        return self._cdp.is_checked(selector)
-
-    def is_selected(self, selector: str) -> bool:
-        """
-        Check whether an element is selected.
-
-        Args:
-            selector (str): The CSS selector for the element.
-
-        Returns:
-            bool: True if the element is selected, otherwise False.
-        """
-        return self._cdp.is_selected(selector)
-
-    def check_if_unchecked(self, selector: str) -> bool:
-        """
-        If a checkbox or radio button is unchecked, check it.
-
-        Args:
-            selector (str): The CSS selector for the element.
-
-        Returns:
-            bool: True if the element was unchecked and has now been checked; otherwise, False.
-        """
-        return self._cdp.check_if_unchecked(selector)
-
-    def select_if_unselected(self, selector: str) -> bool:
-        """
-        If an element is not already selected, select it.
-
-        Args:
-            selector (str): The CSS selector for the element.
-
-        Returns:
-            bool: True if the element was unselected and is now selected; otherwise, False.
-        """
-        return self._cdp.select_if_unselected(selector)
-
-    def uncheck_if_checked(self, selector: str) -> bool:
-        """
-        Uncheck a checkbox or radio button if it is currently checked.
-
-        Args:
-            selector (str): The CSS selector for the element.
-
-        Returns:
-            bool: True if the element was checked and has now been unchecked; otherwise, False.
-        """
-        return self._cdp.uncheck_if_checked(selector)
-
-    def unselect_if_selected(self, selector: str) -> bool:
-        """
-        Unselect an element if it is currently selected.
-
-        Args:
-            selector (str): The CSS selector for the element.
-
-        Returns:
-            bool: True if the element was selected and has now been unselected; otherwise, False.
-        """
-        return self._cdp.unselect_if_selected(selector)
-
-    def is_element_present(self, selector: str) -> bool:
-        """
-        Check if an element exists in the DOM.
-
-        Args:
-            selector (str): The CSS selector for the element.
-
-        Returns:
-            bool: True if the element is present, otherwise False.
-        """
-        return self._cdp.is_element_present(selector)
-
-    def is_text_visible(self, text: str, selector: str = "body") -> bool:
-        """
-        Check if a specific text is visible on the page.
-
-        Args:
-            text (str): The text to check for.
-            selector (str): The CSS selector within which to search (default is "body").
-
-        Returns:
-            bool: True if the text is visible, otherwise False.
-        """
-        return self._cdp.is_text_visible(text, selector)
-
-    def is_exact_text_visible(self, text: str, selector: str = "body") -> bool:
-        """
-        Check if an exact text string is visible on the page.
-
-        Args:
-            text (str): The exact text to check for.
-            selector (str): The CSS selector within which to search (default is "body").
-
-        Returns:
-            bool: True if the exact text is visible, otherwise False.
-        """
-        return self._cdp.is_exact_text_visible(text, selector)
-
-    def wait_for_text(
-        self, text: str, selector: str = "body", timeout: Optional[int] = None
-    ) -> bool:
-        """
-        Wait until a specific text appears on the page.
-
-        Args:
-            text (str): The text to wait for.
-            selector (str): The CSS selector within which to check (default is "body").
-            timeout (Optional[int]): Maximum time to wait in seconds.
-
-        Returns:
-            bool: True if the text appears before the timeout, otherwise False.
-        """
-        return self._cdp.wait_for_text(text, selector, timeout)
-
-    def wait_for_text_not_visible(
-        self, text: str, selector: str = "body", timeout: Optional[int] = None
-    ) -> bool:
-        """
-        Wait until a specific text disappears from the page.
-
-        Args:
-            text (str): The text to wait to disappear.
-            selector (str): The CSS selector within which to check (default is "body").
-            timeout (Optional[int]): Maximum time to wait in seconds.
-
-        Returns:
-            bool: True if the text is no longer visible before the timeout, otherwise False.
-        """
-        return self._cdp.wait_for_text_not_visible(text, selector, timeout)
-
-    def wait_for_element_visible(
-        self, selector: str, timeout: Optional[int] = None
-    ) -> bool:
-        """
-        Wait until an element becomes visible.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            timeout (Optional[int]): Maximum time to wait in seconds.
-
-        Returns:
-            bool: True if the element becomes visible before the timeout, otherwise False.
-        """
-        return self._cdp.wait_for_element_visible(selector, timeout)
-
-    def wait_for_element_not_visible(
-        self, selector: str, timeout: Optional[int] = None
-    ) -> bool:
-        """
-        Wait until an element is no longer visible.
+        Wait until an element is no longer visible.
 
         Args:
             selector (str): The CSS selector for the element.
@@ -1309,7 +1935,19 @@ class CDPWrapper:
         Returns:
             bool: True if the element is not visible before the timeout, otherwise False.
         """
-        return self._cdp.wait_for_element_not_visible(selector, timeout)
+        if not self._is_plain_css(selector):
+            return self._cdp.wait_for_element_not_visible(selector, timeout)
+        predicate = "!(%s)" % _render_js(
+            _JS_VISIBLE, self._js_selector(selector)
+        )
+        if self._wait_predicate(predicate, timeout):
+            return True
+        timeout = timeout or settings.SMALL_TIMEOUT
+        plural = "" if timeout == 1 else "s"
+        raise Exception(
+            "Element {%s} was still visible after %s second%s!"
+            % (selector, timeout, plural)
+        )
 
     def wait_for_element_absent(
         self, selector: str, timeout: Optional[int] = None
@@ -1324,329 +1962,83 @@ class CDPWrapper:
         Returns:
             bool: True if the element is absent before the timeout, otherwise False.
         """
-        return self._cdp.wait_for_element_absent(selector, timeout)
-
-    def assert_element(self, selector: str, timeout: Optional[int] = None) -> None:
-        """
-        Assert that an element exists in the DOM.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            timeout (Optional[int]): Maximum time to wait in seconds.
-
-        Raises:
-            AssertionError: If the element is not found within the timeout.
-        """
-        return self._cdp.assert_element(selector, timeout)
-
-    def assert_element_visible(
-        self, selector: str, timeout: Optional[int] = None
-    ) -> None:
-        """
-        Assert that an element is visible.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            timeout (Optional[int]): Maximum time to wait in seconds.
-
-        Raises:
-            AssertionError: If the element is not visible within the timeout.
-        """
-        return self._cdp.assert_element_visible(selector, timeout)
-
-    def assert_element_present(
-        self, selector: str, timeout: Optional[int] = None
-    ) -> None:
-        """
-        Assert that an element is present in the DOM.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            timeout (Optional[int]): Maximum time to wait in seconds.
-
-        Raises:
-            AssertionError: If the element is not present within the timeout.
-        """
-        return self._cdp.assert_element_present(selector, timeout)
-
-    def assert_element_absent(
-        self, selector: str, timeout: Optional[int] = None
-    ) -> None:
-        """
-        Assert that an element is absent from the DOM.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            timeout (Optional[int]): Maximum time to wait in seconds.
-
-        Raises:
-            AssertionError: If the element is still present within the timeout.
-        """
-        return self._cdp.assert_element_absent(selector, timeout)
-
-    def assert_element_not_visible(
-        self, selector: str, timeout: Optional[int] = None
-    ) -> None:
-        """
-        Assert that an element is not visible.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            timeout (Optional[int]): Maximum time to wait in seconds.
-
-        Raises:
-            AssertionError: If the element remains visible within the timeout.
-        """
-        return self._cdp.assert_element_not_visible(selector, timeout)
-
-    def assert_element_attribute(
-        self, selector: str, attribute: str, value: Optional[str] = None
-    ) -> None:
-        """
-        Assert that an element has a specific attribute value.
-
-        Args:
-            selector (str): The CSS selector for the element.
-            attribute (str): The attribute name.
-            value (Optional[str]): The expected value of the attribute.
-
-        Raises:
-            AssertionError: If the attribute's value does not match.
-        """
-        return self._cdp.assert_element_attribute(selector, attribute, value)
-
-    def assert_title(self, title: str) -> None:
-        """
-        Assert that the page title exactly matches the expected title.
-
-        Args:
-            title (str): The expected page title.
-
-        Raises:
-            AssertionError: If the title does not match.
-        """
-        return self._cdp.assert_title(title)
-
-    def assert_title_contains(self, substring: str) -> None:
-        """
-        Assert that the page title contains the given substring.
-
-        Args:
-            substring (str): The substring that should be present in the title.
-
-        Raises:
-            AssertionError: If the substring is not found in the title.
-        """
-        return self._cdp.assert_title_contains(substring)
-
-    def assert_url(self, url: str) -> None:
-        """
-        Assert that the current URL exactly matches the expected URL.
-
-        Args:
-            url (str): The expected URL.
-
-        Raises:
-            AssertionError: If the URL does not match.
-        """
-        return self._cdp.assert_url(url)
-
-    def assert_url_contains(self, substring: str) -> None:
-        """
-        Assert that the current URL contains a specified substring.
-
-        Args:
-            substring (str): The substring that should be found in the URL.
-
-        Raises:
-            AssertionError: If the substring is not present in the URL.
-        """
-        return self._cdp.assert_url_contains(substring)
-
-    def assert_text(
-        self, text: str, selector: str = "html", timeout: Optional[int] = None
-    ) -> None:
-        """
-        Assert that the given text appears on the page within the specified element.
-
-        Args:
-            text (str): The text to look for.
-            selector (str): The CSS selector for the element (default "html").
-            timeout (Optional[int]): Maximum time to wait in seconds.
-
-        Raises:
-            AssertionError: If the text does not appear within the timeout.
-        """
-        return self._cdp.assert_text(text, selector, timeout)
-
-    def assert_exact_text(
-        self, text: str, selector: str = "html", timeout: Optional[int] = None
-    ) -> None:
-        """
-        Assert that the given exact text appears on the page within the specified element.
-
-        Args:
-            text (str): The exact text to match.
-            selector (str): The CSS selector for the element (default "html").
-            timeout (Optional[int]): Maximum time to wait in seconds.
-
-        Raises:
-            AssertionError: If the exact text does not appear within the timeout.
-        """
-        return self._cdp.assert_exact_text(text, selector, timeout)
-
-    def assert_text_not_visible(
-        self, text: str, selector: str = "body", timeout: Optional[int] = None
-    ) -> None:
-        """
-        Assert that a specified text does not appear on the page.
-
-        Args:
-            text (str): The text that should not be visible.
-            selector (str): The CSS selector for the element (default "body").
-            timeout (Optional[int]): Maximum time to wait in seconds.
-
-        Raises:
-            AssertionError: If the text is visible within the timeout.
-        """
-        return self._cdp.assert_text_not_visible(text, selector, timeout)
-
-    def assert_true(self, expr: bool) -> None:
-        """
-        Assert that a given expression is True.
-
-        Args:
-            expr (bool): The expression to evaluate.
-
-        Raises:
-            AssertionError: If the expression is not True.
-        """
-        return self._cdp.assert_true(expr)
-
-    def assert_false(self, expr: bool) -> None:
-        """
-        Assert that a given expression is False.
-
-        Args:
-            expr (bool): The expression to evaluate.
-
-        Raises:
-            AssertionError: If the expression is not False.
-        """
-        return self._cdp.assert_false(expr)
-
-    def assert_equal(self, first: Any, second: Any) -> None:
-        """
-        Assert that two values are equal.
-
-        Args:
-            first (Any): The first value.
-            second (Any): The second value.
-
-        Raises:
-            AssertionError: If the two values are not equal.
-        """
-        return self._cdp.assert_equal(first, second)
-
-    def assert_not_equal(self, first: Any, second: Any) -> None:
-        """
-        Assert that two values are not equal.
-
-        Args:
-            first (Any): The first value.
-            second (Any): The second value.
-
-        Raises:
-            AssertionError: If the two values are equal.
-        """
-        return self._cdp.assert_not_equal(first, second)
-
-    def assert_in(self, first: Any, second: Any) -> None:
-        """
-        Assert that a value exists within a collection.
-
-        Args:
-            first (Any): The value to search for.
-            second (Any): The collection to search in.
-
-        Raises:
-            AssertionError: If the value is not found in the collection.
-        """
-        return self._cdp.assert_in(first, second)
-
-    def assert_not_in(self, first: Any, second: Any) -> None:
-        """
-        Assert that a value does not exist within a collection.
-
-        Args:
-            first (Any): The value that should not be present.
-            second (Any): The collection to check.
-
-        Raises:
-            AssertionError: If the value is found in the collection.
-        """
-        return self._cdp.assert_not_in(first, second)
-
-    def scroll_into_view(self, selector: str) -> None:
-        """
-        Scroll the page such that the element specified by the selector comes into view.
-
-        Args:
-            selector (str): The CSS selector for the element.
-        """
-        return self._cdp.scroll_into_view(selector)
-
-    def scroll_to_y(self, y: int) -> None:
-        """
-        Scroll the page vertically to a specific y-coordinate.
-
-        Args:
-            y (int): The y-coordinate to scroll to.
-        """
-        return self._cdp.scroll_to_y(y)
-
-    def scroll_to_top(self) -> None:
-        """
-        Scroll to the very top of the page.
-        """
-        return self._cdp.scroll_to_top()
-
-    def scroll_to_bottom(self) -> None:
-        """
-        Scroll to the very bottom of the page.
-        """
-        return self._cdp.scroll_to_bottom()
-
-    def scroll_up(self, amount: int = 25) -> None:
-        """
-        Scroll upward by a given number of pixels.
-
-        Args:
-            amount (int): The number of pixels to scroll up (default is 25).
-        """
-        return self._cdp.scroll_up(amount)
-
-    def scroll_down(self, amount: int = 25) -> None:
-        """
-        Scroll downward by a given number of pixels.
-
-        Args:
-            amount (int): The number of pixels to scroll down (default is 25).
-        """
-        return self._cdp.scroll_down(amount)
-
-    def save_screenshot(
-        self, name: str, folder: Optional[str] = None, selector: Optional[str] = None
-    ) -> str:
-        """
-        Save a screenshot of the current page or a specific element.
-
-        Args:
-            name (str): The file name for the screenshot.
-            folder (Optional[str]): The folder in which to save the screenshot.
-            selector (Optional[str]): If provided, only capture the element matching this selector.
+        if not self._is_plain_css(selector):
+            return self._cdp.wait_for_element_absent(selector, timeout)
+        predicate = "!(%s)" % _render_js(
+            _JS_PRESENT, self._js_selector(selector)
+        )
+        if self._wait_predicate(predicate, timeout):
+            return True
+        timeout = timeout or settings.SMALL_TIMEOUT
+        plural = "" if timeout == 1 else "s"
+        raise Exception(
+            "Element {%s} was still present after %s second%s!"
+            % (selector, timeout, plural)
+        )
+
+
+
+class CDPPipeline:
+    """Batching proxy created by CDPWrapper.pipeline().
+
+    Attribute calls record (name, args, kwargs) instead of executing;
+    send() records raw CDP command objects. flush() (called on context
+    exit) dispatches consecutive raw commands with a single
+    asyncio.gather on the CDP event loop and runs facade calls in
+    order, collecting every result in .results.
+    """
 
-        Returns:
-            str: The path to the saved screenshot file.
-        """
-        return self._cdp.save_screenshot(name, folder, selector)
+    __slots__ = ("_wrapper", "_calls", "results")
+
+    _SEND = "__send__"
+
+    def __init__(self, wrapper: CDPWrapper):
+        self._wrapper = wrapper
+        self._calls = []
+        self.results = []
+
+    def send(self, command: Any) -> None:
+        """Queue a raw CDP command object (e.g. a mycdp generator)."""
+        self._calls.append((self._SEND, (command,), {}))
+
+    def __getattr__(self, name: str) -> Callable:
+        if name.startswith("_"):
+            raise AttributeError(
+                "'%s' object has no attribute '%s'"
+                % (type(self).__name__, name)
+            )
+
+        def _queue(*args, **kwargs) -> None:
+            self._calls.append((name, args, kwargs))
+
+        return _queue
+
+    def __enter__(self) -> "CDPPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def flush(self) -> List[Any]:
+        """Dispatch all queued calls and return the results in order."""
+        calls, self._calls = self._calls, []
+        i = 0
+        while i < len(calls):
+            name, args, kwargs = calls[i]
+            if name == self._SEND:
+                # Gather the whole run of consecutive raw commands in
+                # one trip on the CDP loop.
+                commands = [args[0]]
+                while (
+                    i + 1 < len(calls) and calls[i + 1][0] == self._SEND
+                ):
+                    i += 1
+                    commands.append(calls[i][1][0])
+                self.results.extend(self._wrapper.send_many(commands))
+            else:
+                self.results.append(
+                    getattr(self._wrapper, name)(*args, **kwargs)
+                )
+            i += 1
+        return self.results
@@ -1,21 +1,99 @@
-from typing import Optional, Any, Union, Protocol, List
+from __future__ import annotations
 
+import json
+import os
+import pickle
+import time
 
+from typing import Optional, Any, Union, Protocol, List
+from typing import Final, TYPE_CHECKING, final
+
+from seleniumbase.fixtures import constants
+
+if TYPE_CHECKING:
+    from seleniumbase import BaseCase
+
+# Cookie fields Network.setCookies accepts; getAllCookies results also
+# carry read-only metadata (size, session, ...) that must be dropped.
+_COOKIE_FIELDS = (
+    "name",
+    "value",
+    "url",
+    "domain",
+    "path",
+    "secure",
+    "httpOnly",
+    "sameSite",
+    "expires",
+)
+
+
+def _cookies_file_path(name: str) -> str:
+    """Resolve a cookie filename inside SB's saved_cookies folder.
+
+    Mirrors BaseCase.save_cookies: directories are stripped from the
+    name, ".txt" is appended when no known extension is given, and the
+    storage folder is created on demand, so the CDP fast paths and the
+    SeleniumBase fallbacks always agree on the file location.
+    """
+    if name.endswith("/"):
+        raise Exception("Invalid filename for Cookies!")
+    if "/" in name:
+        name = name.split("/")[-1]
+    if "\\" in name:
+        name = name.split("\\")[-1]
+    if len(name) < 1:
+        raise Exception("Filename for Cookies is too short!")
+    if not name.endswith(".txt") and not name.endswith(".pkl"):
+        name = name + ".txt"
+    folder = os.path.join(
+        os.path.abspath("."), constants.SavedCookies.STORAGE_FOLDER
+    )
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    return os.path.join(folder, name)
+
+
+@final
 class DriverWrapper:
-    """Wrapper for SeleniumBase's regular driver operations."""
+    """Wrapper for SeleniumBase's regular driver operations.
+
+    Marked @final with a concretely-typed _sb so CPython 3.11+'s
+    adaptive interpreter can keep its LOAD_ATTR/CALL inline caches
+    hot across calls.
+    """
+
+    _sb: Final[BaseCase]
+
+    __slots__ = ("_sb", "_read_cache")
 
-    __slots__ = ("_sb",)
+    # Each get_url()/get_title() is a WebDriver HTTP round-trip;
+    # back-to-back reads within this window share one. Navigation
+    # events are not observable through the sync Selenium facade, so
+    # the TTL bounds the staleness instead.
+    _READ_TTL = 0.05
 
     def __init__(self, sb):
         self._sb = sb
+        self._read_cache = {}
+
+    def _cached_read(self, name: str) -> Any:
+        """Serve an idempotent zero-arg read through a short TTL cache."""
+        entry = self._read_cache.get(name)
+        now = time.monotonic()
+        if entry is not None and now - entry[1] < self._READ_TTL:
+            return entry[0]
+        value = getattr(self._sb, name)()
+        self._read_cache[name] = (value, now)
+        return value
 
     def get_url(self) -> str:
         """Get the current URL."""
-        return self._sb.get_current_url()
+        return self._cached_read("get_current_url")
 
     def get_title(self) -> str:
         """Get the title of the current page."""
-        return self._sb.get_title()
+        return self._cached_read("get_title")
 
     def execute_script(self, script: str, *args) -> Any:
         """Execute JavaScript in the current window/frame."""
@@ -50,9 +128,73 @@ class DriverWrapper:
         self._sb.maximize_window()
 
     def save_cookies(self, name: str = "cookies.txt") -> None:
-        """Save browser cookies to file."""
-        self._sb.save_cookies(name)
+        """Save browser cookies to file.
+
+        Files land in SeleniumBase's "saved_cookies" folder, the same
+        location its own save_cookies/load_cookies use. Cookies are
+        fetched with a single Network.getAllCookies CDP command instead
+        of the per-cookie WebDriver loop, so the stored dicts use CDP
+        field names ("expires") rather than WebDriver ones ("expiry");
+        files written by older SeleniumBase versions still load through
+        the fallback path. Names ending in ".pkl" are written as pickle
+        protocol 5 (fastest to (de)serialize); anything else stays
+        JSON text.
+        """
+        try:
+            cookies = self._sb.driver.execute_cdp_cmd(
+                "Network.getAllCookies", {}
+            )["cookies"]
+        except Exception:
+            return self._sb.save_cookies(name)
+        file_path = _cookies_file_path(name)
+        if file_path.endswith(".pkl"):
+            with open(file_path, "wb") as f:
+                pickle.dump(cookies, f, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            with open(file_path, "w") as f:
+                json.dump(cookies, f)
 
     def load_cookies(self, name: str = "cookies.txt") -> None:
-        """Load cookies from file into browser."""
-        self._sb.load_cookies(name)
+        """Load cookies from file into browser.
+
+        Reads from SeleniumBase's "saved_cookies" folder and restores
+        the whole set with one batched Network.setCookies CDP command;
+        read-only metadata from getAllCookies is dropped before
+        sending. Files holding WebDriver-style cookies (with "expiry"
+        fields, as older saves produced) restore through the
+        SeleniumBase fallback instead.
+        """
+        try:
+            file_path = _cookies_file_path(name)
+            if file_path.endswith(".pkl"):
+                with open(file_path, "rb") as f:
+                    cookies = pickle.load(f)
+            else:
+                with open(file_path) as f:
+                    cookies = json.load(f)
+            webdriver_style = any("expiry" in c for c in cookies)
+        except Exception:
+            return self._sb.load_cookies(name)
+        if webdriver_style:
+            # WebDriver-style files (older saves use "expiry") restore
+            # through SeleniumBase, which owns the domain handling for
+            # that schema.
+            return self._sb.load_cookies(name)
+        try:
+            payload = [
+                {
+                    k: v
+                    for k, v in c.items()
+                    if k in _COOKIE_FIELDS
+                    # Session cookies report expires=-1, which
+                    # Network.setCookies rejects; omitting the field
+                    # keeps them session-scoped.
+                    and not (k == "expires" and (v is None or v < 0))
+                }
+                for c in cookies
+            ]
+            self._sb.driver.execute_cdp_cmd(
+                "Network.setCookies", {"cookies": payload}
+            )
+        except Exception:
+            self._sb.load_cookies(name)
@@ -0,0 +1,94 @@
+import asyncio
+import queue
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from .base import UC
+
+
+class UCPool:
+    """Pool of pre-started UC browser sessions for batch scraping.
+
+    Starting a Chromium/chromedriver session costs seconds; the pool
+    pays that cost once per slot and reuses the sessions across tasks,
+    clearing cookies between jobs.
+
+    Example:
+    --------
+    .. code-block:: python
+        from SeleniumUC import UCPool
+
+        pool = UCPool(size=4, uc=True, headless=True)
+        with pool.acquire() as uc:
+            uc.activate_cdp_mode("https://example.com")
+        pool.close()
+    """
+
+    __slots__ = ("_queue", "_size")
+
+    def __init__(self, size: int, **uc_kwargs) -> None:
+        """Eagerly start `size` UC sessions with the given UC() options.
+
+        Args:
+            size (int): Number of browser sessions to keep in the pool.
+            **uc_kwargs: Options forwarded to each UC() instance.
+        """
+        if size < 1:
+            raise ValueError("UCPool size must be at least 1")
+        self._size = size
+        self._queue: "queue.Queue[UC]" = queue.Queue()
+        started = []
+        try:
+            for _ in range(size):
+                uc = UC(**uc_kwargs)
+                uc.__enter__()
+                started.append(uc)
+        except BaseException:
+            for uc in started:
+                uc.__exit__(None, None, None)
+            raise
+        for uc in started:
+            self._queue.put(uc)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[UC]:
+        """Check a UC session out of the pool.
+
+        Cookies are cleared when the session is returned, so the next
+        job starts from a clean slate.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free
+                session before raising queue.Empty.
+        """
+        uc = self._queue.get(timeout=timeout)
+        try:
+            yield uc
+        finally:
+            self.release(uc)
+
+    async def acquire_async(self) -> UC:
+        """Await a free session without blocking the event loop.
+
+        The caller is responsible for handing the session back with
+        release() when the job is done.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._queue.get)
+
+    def release(self, uc: UC) -> None:
+        """Return a session to the pool, clearing its cookies first."""
+        try:
+            uc.delete_all_cookies()
+        except Exception:
+            pass
+        self._queue.put(uc)
+
+    def close(self) -> None:
+        """Shut down every pooled session and empty the pool."""
+        while True:
+            try:
+                uc = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            uc.__exit__(None, None, None)